@@ -6,9 +6,10 @@ Backfill script that extracts all available N-PORT quarters to MinIO.
 
 Smart features:
 1. Uses already-downloaded zips from ./downloaded_zips if they exist
-2. Only downloads from SEC.gov if zip doesn't exist locally
+2. Only downloads from SEC.gov if zip doesn't exist locally, resuming
+   interrupted downloads instead of starting over
 3. Skips quarters already in MinIO (unless --force)
-4. Processes quarters sequentially with progress tracking
+4. Processes several quarters concurrently with progress tracking
 5. Stops on errors for manual intervention
 
 Usage:
@@ -17,66 +18,218 @@ Usage:
     python backfill_extract_to_minio.py --zip-dir ./my_zips  # Use different zip directory
 """
 
+import re
 import sys
 import time
+from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-import tempfile
-import zipfile
 import dlt
+import duckdb
 from config_helper import ConfigManager
 from nport_extract_to_minio import (
     get_s3_client,
     quarter_to_date,
     download_quarterly_zip,
-    extract_tsv_files,
-    upload_to_minio,
-    check_quarter_exists_in_minio,
+    stage_quarter_to_minio,
+    load_existing_partitions,
+    SEC_SESSION,
     MINIO_BUCKET,
     MINIO_BASE_PATH,
     MINIO_ENDPOINT
 )
 
-# Import check_available_quarters from existing script
-import requests
 SEC_GOV_BASE_URL = "https://www.sec.gov/files/dera/data/form-n-port-data-sets"
-USER_AGENT = "YourName your.email@example.com"
 
+# Matches zips saved by download_quarterly_zip, e.g. 2024q4_nport.zip
+LOCAL_ZIP_PATTERN = re.compile(r"(\d{4})q(\d)_nport\.zip")
 
-def check_available_quarters(start_year: int = 2019, end_year: int = 2025):
+# Number of concurrent HEAD checks against SEC.gov - SEC_SESSION paces
+# the requests themselves to the SEC fair-access rate
+HEAD_WORKERS = 8
+
+# Number of quarters processed concurrently (download + upload)
+QUARTER_WORKERS = 4
+
+# Number of SEC.gov zips prefetched concurrently ahead of processing
+DOWNLOAD_WORKERS = 8
+
+# Number of TSV files converted and uploaded concurrently per quarter
+UPLOAD_WORKERS = 8
+
+# Flush extraction metadata to the destination every N quarters
+METADATA_FLUSH_EVERY = 10
+
+# Plan statuses
+STATUS_SKIP = "[SKIP - Already in MinIO]"
+STATUS_LOCAL = "[USE LOCAL ZIP]"
+STATUS_DOWNLOAD = "[DOWNLOAD FROM SEC.gov]"
+
+
+@dataclass
+class QuarterPlan:
+    """Precomputed state for one quarter, shared by planning and processing."""
+    year: int
+    quarter: int
+    as_at_date: str
+    zip_path: Path
+    exists_locally: bool
+    exists_minio: bool
+    status: str
+
+
+def check_available_quarters(
+    start_year: int = 2019,
+    end_year: int = 2025,
+    zip_dir: Path = None
+):
     """
     Check which quarterly datasets are available on SEC.gov.
 
+    Quarters whose zip is already in zip_dir are available without any
+    network call. The remaining HEAD requests are dispatched concurrently
+    over the shared SEC_SESSION, which keeps them under SEC.gov's request
+    rate limit.
+
+    Only a 404 marks a quarter as not available. Any other failure (after
+    SEC_SESSION's retries) stops the check, so a throttled or failed
+    request never silently drops a quarter from the backfill.
+
+    Args:
+        start_year: First year to check
+        end_year: Last year to check
+        zip_dir: Directory containing already-downloaded zips, if any
+
     Returns:
         List of (year, quarter) tuples for available datasets
+
+    Raises:
+        RuntimeError: If any quarter could not be checked
     """
     available = []
+    errors = []
 
     print("\n" + "="*80)
     print("CHECKING AVAILABLE QUARTERS")
     print("="*80)
 
-    for year in range(start_year, end_year + 1):
-        for quarter in range(1, 5):
-            url = f"{SEC_GOV_BASE_URL}/{year}q{quarter}_nport.zip"
-
+    local = set()
+    if zip_dir is not None:
+        for path in zip_dir.glob("*_nport.zip"):
+            match = LOCAL_ZIP_PATTERN.fullmatch(path.name)
+            if match and start_year <= int(match.group(1)) <= end_year:
+                local.add((int(match.group(1)), int(match.group(2))))
+
+    candidates = [
+        (year, quarter, f"{SEC_GOV_BASE_URL}/{year}q{quarter}_nport.zip")
+        for year in range(start_year, end_year + 1)
+        for quarter in range(1, 5)
+        if (year, quarter) not in local
+    ]
+
+    # Results keyed by (year, quarter) so output stays in calendar order
+    results = {}
+
+    with ThreadPoolExecutor(max_workers=HEAD_WORKERS) as executor:
+        futures = {
+            # HEAD request to check if file exists (faster than GET)
+            executor.submit(SEC_SESSION.head, url, timeout=10): (year, quarter)
+            for year, quarter, url in candidates
+        }
+
+        for future in as_completed(futures):
+            year_quarter = futures[future]
             try:
-                # HEAD request to check if file exists (faster than GET)
-                response = requests.head(url, headers={"User-Agent": USER_AGENT}, timeout=10)
+                results[year_quarter] = future.result()
+            except Exception as e:
+                results[year_quarter] = e
 
-                if response.status_code == 200:
-                    # Get file size if available
-                    size_mb = int(response.headers.get('Content-Length', 0)) / (1024 * 1024)
-                    available.append((year, quarter))
-                    print(f"  [OK] {year} Q{quarter}: Available ({size_mb:.1f} MB)")
-                else:
-                    print(f"  [--] {year} Q{quarter}: Not available")
+    for year, quarter in sorted(local | results.keys()):
+        if (year, quarter) in local:
+            available.append((year, quarter))
+            print(f"  [OK] {year} Q{quarter}: Available (local zip)")
+            continue
 
-            except Exception as e:
-                print(f"  [!!] {year} Q{quarter}: Error checking ({e})")
+        response = results[(year, quarter)]
+
+        if isinstance(response, Exception):
+            errors.append((year, quarter))
+            print(f"  [!!] {year} Q{quarter}: Error checking ({response})")
+        elif response.status_code == 200:
+            # Get file size if available
+            size_mb = int(response.headers.get('Content-Length', 0)) / (1024 * 1024)
+            available.append((year, quarter))
+            print(f"  [OK] {year} Q{quarter}: Available ({size_mb:.1f} MB)")
+        elif response.status_code == 404:
+            print(f"  [--] {year} Q{quarter}: Not available")
+        else:
+            errors.append((year, quarter))
+            print(f"  [!!] {year} Q{quarter}: Error checking (HTTP {response.status_code})")
+
+    if errors:
+        failed = ", ".join(f"{year} Q{quarter}" for year, quarter in errors)
+        raise RuntimeError(f"Could not check availability of {failed} on SEC.gov - re-run to retry")
 
     return available
 
 
+def process_quarter(
+    plan: QuarterPlan,
+    s3_client,
+    con: duckdb.DuckDBPyConnection,
+    download: Future = None
+) -> dict:
+    """
+    Download (if needed) and stage a single quarter to MinIO.
+
+    Safe to run concurrently for different quarters - each call works on
+    its own zip file and boto3 clients are thread-safe.
+
+    Args:
+        plan: Precomputed plan for the quarter
+        s3_client: Boto3 S3 client
+        con: DuckDB connection shared by all quarters
+        download: Prefetch of the zip already in flight, if any
+
+    Returns:
+        Extraction metadata record for the quarter
+    """
+    quarter_start = time.time()
+    year, quarter = plan.year, plan.quarter
+    zip_path = plan.zip_path
+
+    print(f"\n[*] Processing {year} Q{quarter} (_as_at_date: {plan.as_at_date})")
+
+    # Step 1: Get or download zip
+    if download is not None:
+        print(f"[*] Waiting for prefetched {zip_path.name}...")
+        zip_path = download.result()
+    elif plan.exists_locally:
+        print(f"[*] Using existing zip: {zip_path.name}")
+    else:
+        print(f"[*] Downloading {zip_path.name} from SEC.gov...")
+        zip_path = download_quarterly_zip(year, quarter, zip_path.parent)
+
+    # Step 2: Convert TSV files to Parquet and upload to MinIO
+    print(f"\n[*] Staging {year} Q{quarter} Parquet files to MinIO...")
+    uploaded_keys = stage_quarter_to_minio(
+        zip_path, year, quarter, s3_client, max_workers=UPLOAD_WORKERS, con=con
+    )
+
+    quarter_elapsed = time.time() - quarter_start
+    print(f"\n[+] Successfully uploaded {len(uploaded_keys)} files for {year} Q{quarter}")
+    print(f"[+] {year} Q{quarter} completed in {quarter_elapsed:.1f}s")
+
+    return {
+        "year": year,
+        "quarter": quarter,
+        "as_at_date": plan.as_at_date,
+        "status": "success",
+        "files_uploaded": len(uploaded_keys),
+        "used_local_zip": plan.exists_locally
+    }
+
+
 def backfill_extract_to_minio(
     zip_dir: Path = None,
     force: bool = False,
@@ -109,11 +262,14 @@ def backfill_extract_to_minio(
     print("="*80)
 
     # Get S3 client
-    s3_client = get_s3_client()
+    s3_client = get_s3_client(concurrent_quarters=QUARTER_WORKERS, stage_workers=UPLOAD_WORKERS)
+
+    # One LIST up front instead of a probe per quarter
+    existing_partitions = load_existing_partitions(s3_client)
 
     # Check available quarters on SEC.gov
     print("\n[*] Checking available quarters from SEC.gov...")
-    available = check_available_quarters(start_year, end_year)
+    available = check_available_quarters(start_year, end_year, zip_dir)
 
     if not available:
         print("\n[!] No quarters available. Exiting.")
@@ -124,30 +280,45 @@ def backfill_extract_to_minio(
 
     print(f"\n[+] Found {len(available)} available quarters")
 
-    # Display plan
-    print("\n" + "="*80)
-    print("EXTRACTION PLAN")
-    print("="*80)
-    print(f"\nWill process {len(available)} quarters:\n")
-
+    # Build the plan once - both the display and processing loops use it
+    plans = []
     for year, quarter in available:
-        as_at_date = quarter_to_date(year, quarter)
-        zip_filename = f"{year}q{quarter}_nport.zip"
-        zip_path = zip_dir / zip_filename
-
-        # Check status
+        zip_path = zip_dir / f"{year}q{quarter}_nport.zip"
         exists_locally = zip_path.exists()
-        exists_minio = check_quarter_exists_in_minio(year, quarter, s3_client)
+        exists_minio = (year, quarter) in existing_partitions
 
-        status = ""
         if exists_minio and not force:
-            status = "[SKIP - Already in MinIO]"
+            status = STATUS_SKIP
         elif exists_locally:
-            status = "[USE LOCAL ZIP]"
+            status = STATUS_LOCAL
         else:
-            status = "[DOWNLOAD FROM SEC.gov]"
+            status = STATUS_DOWNLOAD
+
+        plans.append(QuarterPlan(
+            year=year,
+            quarter=quarter,
+            as_at_date=quarter_to_date(year, quarter),
+            zip_path=zip_path,
+            exists_locally=exists_locally,
+            exists_minio=exists_minio,
+            status=status,
+        ))
+
+    # Partial downloads of quarters that no longer need downloading (staged
+    # already, or with a complete local zip) will never be resumed
+    for plan in plans:
+        if plan.status != STATUS_DOWNLOAD:
+            for suffix in (".part", ".etag"):
+                plan.zip_path.with_name(plan.zip_path.name + suffix).unlink(missing_ok=True)
+
+    # Display plan
+    print("\n" + "="*80)
+    print("EXTRACTION PLAN")
+    print("="*80)
+    print(f"\nWill process {len(plans)} quarters:\n")
 
-        print(f"  {year} Q{quarter} -> {as_at_date}: {status}")
+    for plan in plans:
+        print(f"  {plan.year} Q{plan.quarter} -> {plan.as_at_date}: {plan.status}")
 
     # Confirm
     print("\n" + "="*80)
@@ -177,90 +348,102 @@ def backfill_extract_to_minio(
     skipped = []
     failed = []
 
-    for idx, (year, quarter) in enumerate(available, 1):
-        as_at_date = quarter_to_date(year, quarter)
+    # Metadata rows are buffered and written in batches rather than one
+    # destination commit per quarter
+    metadata_rows = []
 
-        print(f"\n{'='*80}")
-        print(f"[{idx}/{len(available)}] Processing {year} Q{quarter}")
-        print(f"_as_at_date: {as_at_date}")
-        print(f"{'='*80}")
+    @dlt.resource(name="extract_metadata", write_disposition="append")
+    def metadata():
+        yield from metadata_rows
 
-        quarter_start = time.time()
+    def flush_metadata():
+        if metadata_rows:
+            pipeline.run(metadata())
+            metadata_rows.clear()
 
-        # Check if already in MinIO
-        if not force and check_quarter_exists_in_minio(year, quarter, s3_client):
-            print(f"[*] Quarter {year} Q{quarter} already exists in MinIO - skipping")
-            skipped.append((year, quarter))
-            continue
+    to_process = []
+    for plan in plans:
+        if plan.status == STATUS_SKIP:
+            print(f"[*] Quarter {plan.year} Q{plan.quarter} already exists in MinIO - skipping")
+            skipped.append((plan.year, plan.quarter))
+        else:
+            to_process.append(plan)
 
-        zip_filename = f"{year}q{quarter}_nport.zip"
-        zip_path = zip_dir / zip_filename
-
-        try:
-            # Step 1: Get or download zip
-            if zip_path.exists():
-                print(f"[*] Using existing zip: {zip_path.name}")
-                file_size_mb = zip_path.stat().st_size / (1024 * 1024)
-                print(f"[+] Zip size: {file_size_mb:.1f} MB")
-            else:
-                print(f"[*] Downloading {zip_filename} from SEC.gov...")
-                zip_path = download_quarterly_zip(year, quarter, zip_dir)
-
-            # Step 2: Extract TSV files to temp directory
-            print(f"\n[*] Extracting TSV files...")
-            with tempfile.TemporaryDirectory() as temp_dir:
-                extract_dir = Path(temp_dir)
-                tsv_files = extract_tsv_files(zip_path, extract_dir)
-
-                # Step 3: Upload to MinIO
-                print(f"\n[*] Uploading {len(tsv_files)} files to MinIO...")
-                uploaded_keys = []
-                for tsv_file in tsv_files:
-                    s3_key = upload_to_minio(tsv_file, year, quarter, s3_client)
-                    uploaded_keys.append(s3_key)
-
-                print(f"\n[+] Successfully uploaded {len(uploaded_keys)} files for {year} Q{quarter}")
-
-            # Track in DLT metadata
-            @dlt.resource(name="extract_metadata", write_disposition="append")
-            def metadata():
-                yield {
-                    "year": year,
-                    "quarter": quarter,
-                    "as_at_date": as_at_date,
-                    "status": "success",
-                    "files_uploaded": len(uploaded_keys),
-                    "used_local_zip": zip_path.exists()
-                }
+    print(f"\n[*] Processing {len(to_process)} quarters with {QUARTER_WORKERS} workers")
 
-            pipeline.run(metadata())
+    # Prefetch missing zips on their own pool so downloads run ahead of the
+    # (slower-moving) quarter workers instead of starting only when a
+    # worker frees up
+    downloader = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS)
+    downloads = {
+        (plan.year, plan.quarter): downloader.submit(
+            download_quarterly_zip, plan.year, plan.quarter, zip_dir
+        )
+        for plan in to_process
+        if plan.status == STATUS_DOWNLOAD
+    }
+    if downloads:
+        print(f"[*] Prefetching {len(downloads)} zips from SEC.gov with {DOWNLOAD_WORKERS} workers")
+
+    # One DuckDB instance for every quarter - concurrent quarters share its
+    # memory limit and thread pool rather than each claiming the machine
+    with duckdb.connect(':memory:') as con, \
+            downloader, ThreadPoolExecutor(max_workers=QUARTER_WORKERS) as executor:
+        futures = {
+            executor.submit(
+                process_quarter, plan, s3_client, con, downloads.get((plan.year, plan.quarter))
+            ): (plan.year, plan.quarter)
+            for plan in to_process
+        }
+
+        for future in as_completed(futures):
+            year, quarter = futures[future]
+
+            try:
+                metadata_rows.append(future.result())
+                processed.append((year, quarter))
 
-            quarter_elapsed = time.time() - quarter_start
-            processed.append((year, quarter))
+                # Track in DLT metadata - runs on this thread only, so the
+                # (non-reentrant) dlt pipeline is never used concurrently
+                if len(metadata_rows) >= METADATA_FLUSH_EVERY:
+                    flush_metadata()
 
-            print(f"\n[+] {year} Q{quarter} completed in {quarter_elapsed:.1f}s")
-            print(f"[*] Progress: {len(processed)}/{len(available)} quarters processed, {len(skipped)} skipped")
+                print(f"[*] Progress: {len(processed)}/{len(to_process)} quarters processed, {len(skipped)} skipped")
 
-            # Estimate remaining time
-            if processed:
+                # Estimate remaining time
                 avg_time = (time.time() - start_time) / len(processed)
-                remaining = len(available) - len(processed) - len(skipped)
+                remaining = len(to_process) - len(processed)
                 est_remaining_mins = (remaining * avg_time) / 60
                 print(f"[*] Estimated time remaining: {est_remaining_mins:.1f} minutes")
 
-        except Exception as e:
-            quarter_elapsed = time.time() - quarter_start
-            print(f"\n[!] FATAL ERROR: Failed to process {year} Q{quarter}")
-            print(f"[!] Error: {e}")
-            print(f"[!] Time spent: {quarter_elapsed:.1f}s")
-            print(f"\n[!] Stopping extraction. Fix the issue and re-run to continue.")
-            print(f"[!] Successfully processed: {len(processed)} quarters")
-            print(f"[!] Skipped: {len(skipped)} quarters")
-
-            import traceback
-            traceback.print_exc()
-
-            sys.exit(1)
+            except Exception as e:
+                elapsed = time.time() - start_time
+                print(f"\n[!] FATAL ERROR: Failed to process {year} Q{quarter}")
+                print(f"[!] Error: {e}")
+                print(f"[!] Time spent: {elapsed:.1f}s")
+                print(f"\n[!] Stopping extraction. Fix the issue and re-run to continue.")
+                print("[!] Waiting for in-flight quarters to finish...")
+
+                import traceback
+                traceback.print_exc()
+
+                # Drop queued quarters and downloads; wait for running ones
+                downloader.shutdown(wait=False, cancel_futures=True)
+                executor.shutdown(wait=True, cancel_futures=True)
+
+                # Record quarters that finished while we were waiting
+                for other, other_quarter in futures.items():
+                    if (other is not future and other.done() and not other.cancelled()
+                            and other.exception() is None and other_quarter not in processed):
+                        metadata_rows.append(other.result())
+                        processed.append(other_quarter)
+                flush_metadata()
+                print(f"[!] Successfully processed: {len(processed)} quarters")
+                print(f"[!] Skipped: {len(skipped)} quarters")
+
+                sys.exit(1)
+
+    flush_metadata()
 
     # Summary
     total_elapsed = time.time() - start_time
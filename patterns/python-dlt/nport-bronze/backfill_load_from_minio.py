@@ -9,6 +9,8 @@ glob patterns and union_by_name to handle schema evolution.
 
 Key features:
 - Loads all quarters in a single operation per table (very efficient)
+- Loads independent tables concurrently, each worker through its own dlt
+  pipeline (--workers 1 loads them one at a time)
 - Handles schema evolution automatically with union_by_name
 - Skips tables that don't exist in any quarters
 - Shows progress and row counts
@@ -16,11 +18,14 @@ Key features:
 
 Usage:
     python backfill_load_from_minio.py              # Load all data
+    python backfill_load_from_minio.py --fast       # DuckDB bulk load (ducklake/duckdb only)
     python backfill_load_from_minio.py --tables submission registrant  # Specific tables only
 """
 
+import queue
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import dlt
 from pathlib import Path
 from config_helper import ConfigManager
@@ -28,14 +33,130 @@ from config_helper import ConfigManager
 # Import from the load script
 from nport_load_from_minio import (
     nport_minio_source,
+    build_table_query,
+    configure_duckdb_for_minio,
+    get_s3_path_for_table,
+    list_staged_files,
+    get_loader_file_format,
     PIPELINE_NAME,
     DESTINATION,
     DATASET_NAME,
     TABLE_MAPPINGS,
+    INVERSE_TABLE_MAPPINGS,
     MINIO_ENDPOINT,
     MINIO_BUCKET
 )
 
+# Number of tables loaded concurrently, one dlt pipeline per worker. Needs a
+# catalog that takes concurrent writers (postgres for ducklake); sqlite and
+# duckdb ducklake catalogs must be loaded with --workers 1
+TABLE_WORKERS = 4
+
+# Destinations that can run the --fast DuckDB bulk load
+FAST_DESTINATIONS = ("ducklake", "duckdb")
+
+# Columns dlt adds to the tables it loads - a table holding these is managed
+# by dlt and must not be written by the --fast path
+DLT_MANAGED_COLUMNS = {"_dlt_load_id", "_dlt_id"}
+
+
+def load_table(
+    pipeline,
+    table_file: str,
+    year: int,
+    quarter: int,
+    loader_file_format: str = None
+):
+    """
+    Load a single table from MinIO through the given dlt pipeline.
+
+    dlt pipelines are not thread-safe, so a pipeline must only be used by
+    one thread at a time - concurrent loads each check out their own
+    (see backfill_load_from_minio).
+
+    Args:
+        pipeline: dlt pipeline to load through, not in use by another thread
+        table_file: TSV filename (e.g., "SUBMISSION.tsv")
+        year: Optional year filter
+        quarter: Optional quarter filter
+        loader_file_format: File format to load with (see
+            get_loader_file_format), or None for the destination default
+
+    Returns:
+        dlt LoadInfo for the table
+    """
+    # Create source for just this ONE table
+    source = nport_minio_source(
+        year=year,
+        quarter=quarter,
+        tables=[table_file]
+    )
+
+    return pipeline.run(source, loader_file_format=loader_file_format)
+
+
+def fast_load_table(client, table_file: str, year: int, quarter: int, destination: str) -> int:
+    """
+    Bulk load a single table with DuckDB, bypassing dlt's extract/normalize.
+
+    Bronze is a raw passthrough, so the destination's own DuckDB connection
+    reads the staged Parquet from MinIO with its native reader and writes the
+    table directly. Tables are created on first load and appended to by
+    column name afterwards; columns that first appear in later quarters are
+    added to the existing table before the insert.
+
+    Tables written here are not tracked by dlt (no dlt schema entry, no
+    _dlt_load_id/_dlt_id), so a table must be loaded by one mode only. A
+    table that already holds dlt-managed columns is refused.
+
+    Args:
+        client: dlt sql client for a ducklake/duckdb destination
+        table_file: TSV filename (e.g., "SUBMISSION.tsv")
+        year: Optional year filter
+        quarter: Optional quarter filter
+        destination: DLT destination name
+
+    Returns:
+        Number of rows inserted
+
+    Raises:
+        RuntimeError: If the table was created by the regular dlt load
+    """
+    table_name = TABLE_MAPPINGS[table_file]
+    s3_path = get_s3_path_for_table(table_file, year, quarter)
+
+    file_count = list_staged_files(year, quarter).get(table_file, 0)
+    if file_count == 0:
+        print(f"[*] No files found for {table_name} at {s3_path} - skipping")
+        return 0
+
+    print(f"[*] Bulk loading {table_name} from {file_count} file(s) at {s3_path}")
+
+    qualified_name = client.make_qualified_table_name(table_name)
+
+    query = build_table_query(s3_path, year, quarter)
+
+    client.execute_sql(f"CREATE TABLE IF NOT EXISTS {qualified_name} AS SELECT * FROM ({query}) LIMIT 0")
+    if destination == "ducklake":
+        client.execute_sql(f"ALTER TABLE {qualified_name} SET PARTITIONED BY (_as_at_date)")
+
+    # DuckDB column names are case-insensitive
+    table_columns = {row[0].lower() for row in client.execute_sql(f"DESCRIBE {qualified_name}")}
+    if table_columns & DLT_MANAGED_COLUMNS:
+        raise RuntimeError(
+            f"{table_name} was loaded by dlt - load it without --fast, or drop it first"
+        )
+
+    # INSERT ... BY NAME fails on source columns the table lacks, so add
+    # any that first appear in the quarters being loaded
+    for column_name, column_type, *_ in client.execute_sql(f"DESCRIBE {query}"):
+        if column_name.lower() not in table_columns:
+            print(f"[*] Adding new column {column_name} ({column_type}) to {table_name}")
+            client.execute_sql(f'ALTER TABLE {qualified_name} ADD COLUMN "{column_name}" {column_type}')
+
+    result = client.execute_sql(f"INSERT INTO {qualified_name} BY NAME {query}")
+    return result[0][0] if result else 0
+
 
 def backfill_load_from_minio(
     tables: list[str] = None,
@@ -43,7 +164,9 @@ def backfill_load_from_minio(
     quarter: int = None,
     destination: str = None,
     dataset: str = None,
-    skip_confirmation: bool = False
+    skip_confirmation: bool = False,
+    workers: int = TABLE_WORKERS,
+    fast: bool = False
 ):
     """
     Backfill load all N-PORT data from MinIO to destination.
@@ -55,6 +178,8 @@ def backfill_load_from_minio(
         destination: DLT destination (default: from DESTINATION constant)
         dataset: Dataset name (default: from DATASET_NAME constant)
         skip_confirmation: Skip the yes/no confirmation prompt
+        workers: Number of tables loaded concurrently (1 = sequential)
+        fast: Bulk load with DuckDB directly instead of dlt (ducklake/duckdb only)
     """
     print("\n" + "="*80)
     print("N-PORT LOAD BACKFILL FROM MINIO")
@@ -66,11 +191,10 @@ def backfill_load_from_minio(
         valid_tables = []
         for table in tables:
             # Check if it's a table name or TSV filename
-            if table in TABLE_MAPPINGS.values():
+            if table in INVERSE_TABLE_MAPPINGS:
                 # It's a table name - find the TSV filename
-                tsv_file = [k for k, v in TABLE_MAPPINGS.items() if v == table][0]
-                valid_tables.append(tsv_file)
-            elif table in TABLE_MAPPINGS.keys():
+                valid_tables.append(INVERSE_TABLE_MAPPINGS[table])
+            elif table in TABLE_MAPPINGS:
                 # It's a TSV filename
                 valid_tables.append(table)
             else:
@@ -97,8 +221,13 @@ def backfill_load_from_minio(
     print(f"Year filter: {year if year else 'ALL'}")
     print(f"Quarter filter: Q{quarter if quarter else 'ALL'}")
     print(f"Tables to load: {len(table_names)}")
+    print(f"Mode: {'DuckDB bulk load (--fast)' if fast else 'dlt pipeline'}")
     print("="*80)
 
+    if fast and dest not in FAST_DESTINATIONS:
+        print(f"[!] --fast is only supported for {', '.join(FAST_DESTINATIONS)} destinations. Exiting.")
+        sys.exit(1)
+
     # Show tables
     print("\nTables to load:")
     for i, name in enumerate(table_names, 1):
@@ -118,7 +247,7 @@ def backfill_load_from_minio(
     else:
         print("\n[*] Auto-confirming load (--yes flag provided)")
 
-    # Create pipeline
+    # Create pipeline (loads tables, then runs verification queries)
     print("\n[*] Creating DLT pipeline...")
     pipeline = dlt.pipeline(
         pipeline_name=PIPELINE_NAME,
@@ -126,49 +255,98 @@ def backfill_load_from_minio(
         dataset_name=ds
     )
 
-    # Run load - ONE TABLE AT A TIME to ensure commits
+    # Run load - each table commits independently
     print("\n" + "="*80)
-    print("STARTING LOAD (Sequential table-by-table)")
+    if fast:
+        print("STARTING LOAD (DuckDB bulk load, table-by-table)")
+    else:
+        print(f"STARTING LOAD ({workers} tables at a time)")
     print("="*80)
     print()
 
     start_time = time.time()
     loaded_tables = []
     failed_tables = []
+    table_files = tables_to_load if tables_to_load else list(TABLE_MAPPINGS.keys())
 
     try:
-        # Load each table individually to ensure proper commits
-        for idx, table_file in enumerate(tables_to_load if tables_to_load else list(TABLE_MAPPINGS.keys()), 1):
-            table_name = TABLE_MAPPINGS.get(table_file, table_file)
-
-            print(f"\n[{idx}/{len(table_names)}] Loading {table_name}...")
-            print("-" * 80)
-
-            try:
-                # Create source for just this ONE table
-                source = nport_minio_source(
-                    year=year,
-                    quarter=quarter,
-                    tables=[table_file]
-                )
+        if fast:
+            # One destination connection, configured once for MinIO reads
+            with pipeline.sql_client() as client:
+                if not client.has_dataset():
+                    client.create_dataset()
+                configure_duckdb_for_minio(client.native_connection)
+
+                for idx, table_file in enumerate(table_files, 1):
+                    table_name = TABLE_MAPPINGS[table_file]
+
+                    print(f"\n[{idx}/{len(table_names)}] Loading {table_name}...")
+                    print("-" * 80)
+
+                    try:
+                        row_count = fast_load_table(client, table_file, year, quarter, dest)
+                        print(f"[+] SUCCESS: {table_name} ({row_count:,} rows)")
+                        loaded_tables.append(table_name)
+                    except Exception as e:
+                        print(f"[!] ERROR loading {table_name}: {e}")
+                        failed_tables.append(table_name)
+                        # Continue with next table instead of failing entire job
+                        import traceback
+                        traceback.print_exc()
+        else:
+            # One pipeline per worker, each with its own name and state, so
+            # no pipeline is ever used by two threads. A single worker loads
+            # through the main pipeline exactly as a sequential run would
+            loader_file_format = get_loader_file_format(dest)
+
+            idle_pipelines = queue.Queue()
+            idle_pipelines.put(pipeline)
+            for worker in range(1, workers):
+                idle_pipelines.put(dlt.pipeline(
+                    pipeline_name=f"{PIPELINE_NAME}_worker{worker}",
+                    destination=dest,
+                    dataset_name=ds
+                ))
+
+            def load_on_idle_pipeline(table_file: str):
+                # Never blocks - there is a pipeline for every worker thread
+                worker_pipeline = idle_pipelines.get()
+                try:
+                    return load_table(worker_pipeline, table_file, year, quarter, loader_file_format)
+                finally:
+                    idle_pipelines.put(worker_pipeline)
+
+            # Each table still commits independently
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(load_on_idle_pipeline, table_file):
+                        TABLE_MAPPINGS.get(table_file, table_file)
+                    for table_file in table_files
+                }
+
+                for idx, future in enumerate(as_completed(futures), 1):
+                    table_name = futures[future]
+
+                    print(f"\n[{idx}/{len(table_names)}] Finished {table_name}")
+                    print("-" * 80)
 
-                # Load this table
-                load_info = pipeline.run(source)
+                    try:
+                        load_info = future.result()
 
-                # Verify it succeeded
-                if load_info.has_failed_jobs:
-                    print(f"[!] FAILED: {table_name}")
-                    failed_tables.append(table_name)
-                else:
-                    print(f"[+] SUCCESS: {table_name}")
-                    loaded_tables.append(table_name)
+                        # Verify it succeeded
+                        if load_info.has_failed_jobs:
+                            print(f"[!] FAILED: {table_name}")
+                            failed_tables.append(table_name)
+                        else:
+                            print(f"[+] SUCCESS: {table_name}")
+                            loaded_tables.append(table_name)
 
-            except Exception as e:
-                print(f"[!] ERROR loading {table_name}: {e}")
-                failed_tables.append(table_name)
-                # Continue with next table instead of failing entire job
-                import traceback
-                traceback.print_exc()
+                    except Exception as e:
+                        print(f"[!] ERROR loading {table_name}: {e}")
+                        failed_tables.append(table_name)
+                        # Continue with next table instead of failing entire job
+                        import traceback
+                        traceback.print_exc()
 
         elapsed = time.time() - start_time
 
@@ -192,7 +370,7 @@ def backfill_load_from_minio(
 
         # Show load details
         print("\n[*] Pipeline Details:")
-        print(f"  - Pipeline: {PIPELINE_NAME}")
+        print(f"  - Pipeline: {PIPELINE_NAME} (+ {PIPELINE_NAME}_worker<n> when --workers > 1)")
         print(f"  - Dataset: {ds}")
         print(f"  - Destination: {dest}")
 
@@ -204,22 +382,38 @@ def backfill_load_from_minio(
                 print("DATA VERIFICATION")
                 print("="*80)
 
-                for table_name in table_names[:5]:  # Show first 5 tables
-                    try:
-                        result = client.execute_sql(f"""
-                            SELECT
-                                COUNT(*) as total_rows,
-                                COUNT(DISTINCT _as_at_date) as unique_quarters
-                            FROM {ds}.{table_name}
-                        """)
-
-                        for row in result:
-                            total_rows, unique_quarters = row
-                            print(f"\n{table_name}:")
-                            print(f"  Total rows: {total_rows:,}")
-                            print(f"  Quarters: {unique_quarters}")
-                    except Exception as e:
-                        print(f"\n{table_name}: Could not verify ({e})")
+                def print_stats(table_name, total_rows, unique_quarters):
+                    print(f"\n{table_name}:")
+                    print(f"  Total rows: {total_rows:,}")
+                    print(f"  Quarters: {unique_quarters}")
+
+                verify_tables = table_names[:5]  # Show first 5 tables
+
+                # All stats in one round trip; fall back to per-table queries
+                # if any table is missing so the others still get verified
+                stats_sql = " UNION ALL ".join(
+                    f"SELECT '{t}' AS tbl, COUNT(*) AS total_rows, "
+                    f"COUNT(DISTINCT _as_at_date) AS unique_quarters FROM {ds}.{t}"
+                    for t in verify_tables
+                )
+                try:
+                    stats = {row[0]: row[1:] for row in client.execute_sql(stats_sql)}
+                    for table_name in verify_tables:
+                        print_stats(table_name, *stats[table_name])
+                except Exception:
+                    for table_name in verify_tables:
+                        try:
+                            result = client.execute_sql(f"""
+                                SELECT
+                                    COUNT(*) as total_rows,
+                                    COUNT(DISTINCT _as_at_date) as unique_quarters
+                                FROM {ds}.{table_name}
+                            """)
+
+                            for row in result:
+                                print_stats(table_name, *row)
+                        except Exception as e:
+                            print(f"\n{table_name}: Could not verify ({e})")
 
                 if len(table_names) > 5:
                     print(f"\n... and {len(table_names) - 5} more tables")
@@ -310,6 +504,18 @@ if __name__ == "__main__":
         type=str,
         help=f"Dataset name (default: {DATASET_NAME})"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=TABLE_WORKERS,
+        help=f"Number of tables to load concurrently (default: {TABLE_WORKERS}; "
+             "use 1 for ducklake with a sqlite/duckdb catalog)"
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Bulk load with DuckDB directly instead of dlt (ducklake/duckdb destinations only)"
+    )
     parser.add_argument(
         "--yes", "-y",
         action="store_true",
@@ -325,7 +531,9 @@ if __name__ == "__main__":
             quarter=args.quarter,
             destination=args.destination,
             dataset=args.dataset,
-            skip_confirmation=args.yes
+            skip_confirmation=args.yes,
+            workers=args.workers,
+            fast=args.fast
         )
     except KeyboardInterrupt:
         print("\n\n[!] Load interrupted by user")
@@ -9,6 +9,11 @@ import sys
 from pathlib import Path
 import toml
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
 
 class ConfigManager:
     """Manage dlt pipeline configuration."""
@@ -18,17 +23,27 @@ class ConfigManager:
         self.config_file = self.config_dir / "config.toml"
         self.secrets_file = self.config_dir / "secrets.toml"
 
+        # Parsed TOML, cached per instance (config is invalidated on write)
+        self._config_cache = None
+        self._secrets_cache = None
+
     def get_config(self):
         """Load configuration from config.toml."""
-        if not self.config_file.exists():
-            return {}
-        return toml.load(self.config_file)
+        if self._config_cache is None:
+            if not self.config_file.exists():
+                return {}
+            with open(self.config_file, "rb") as f:
+                self._config_cache = tomllib.load(f)
+        return self._config_cache
 
     def get_secrets(self):
         """Load secrets from secrets.toml."""
-        if not self.secrets_file.exists():
-            return {}
-        return toml.load(self.secrets_file)
+        if self._secrets_cache is None:
+            if not self.secrets_file.exists():
+                return {}
+            with open(self.secrets_file, "rb") as f:
+                self._secrets_cache = tomllib.load(f)
+        return self._secrets_cache
 
     def get_active_destination(self):
         """Get the currently active destination."""
@@ -114,6 +129,8 @@ class ConfigManager:
         with open(self.config_file, 'w') as f:
             toml.dump(config, f)
 
+        self._config_cache = None
+
         print(f"\n[+] Active destination set to: {destination}")
 
         if destination == "databricks":
@@ -7,23 +7,37 @@ to MinIO S3-compatible storage in Hive-partitioned structure.
 
 This pipeline:
 1. Downloads quarterly zip files from SEC.gov
-2. Extracts TSV files from the zip
-3. Uploads TSVs to MinIO in Hive partition format:
-   s3://nport-raw/files/year=YYYY/quarter=Q/TABLE_NAME.tsv
+2. Converts each TSV in the zip to ZSTD-compressed Parquet with DuckDB,
+   typed from the SEC table schemas (nport_schemas.py)
+3. Uploads the Parquet files to MinIO in Hive partition format:
+   s3://nport-raw/files/year=YYYY/quarter=Q/TABLE_NAME.parquet
 
 The staged files can then be loaded by the companion pipeline:
 nport_load_from_minio.py
 """
 
+import contextlib
+import io
+import re
+import shutil
+import threading
+import time
 import dlt
+import duckdb
 import tempfile
 import zipfile
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterator, Tuple
+from typing import BinaryIO, Iterator, Optional, Tuple, Union
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.client import Config
+from botocore.exceptions import ClientError
 from config_helper import ConfigManager
+from nport_schemas import TABLE_SCHEMAS, TSV_DATE_FORMAT
 
 # =============================================================================
 # CONFIGURATION
@@ -33,6 +47,75 @@ PIPELINE_NAME = "nport_extract_to_minio"
 SEC_BASE_URL = "https://www.sec.gov/files/dera/data/form-n-port-data-sets"
 USER_AGENT = "YourName your.email@example.com"  # SEC requires identification
 
+# SEC.gov fair-access policy allows 10 requests/second per client; stay
+# below it across all threads sharing SEC_SESSION
+SEC_MAX_REQUESTS_PER_SECOND = 8
+
+# (connect, read) timeout in seconds for SEC.gov requests - the read timeout
+# applies per socket read, so a large download only fails if it stalls
+SEC_REQUEST_TIMEOUT = (10, 60)
+
+
+class RateLimiter:
+    """Spaces out calls to wait() across all threads sharing the limiter."""
+
+    def __init__(self, requests_per_second: float):
+        self._interval = 1 / requests_per_second
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        # Reserve the next free slot, then sleep outside the lock
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+SEC_RATE_LIMITER = RateLimiter(SEC_MAX_REQUESTS_PER_SECOND)
+
+
+class RateLimitedRetry(Retry):
+    """
+    Retry that also waits for SEC_RATE_LIMITER before every retried attempt.
+
+    urllib3 retries inside the adapter, below RateLimitedAdapter.send, so
+    without this a burst of retries would bypass the rate limit.
+    """
+
+    def sleep(self, response=None):
+        super().sleep(response)
+        SEC_RATE_LIMITER.wait()
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that waits for SEC_RATE_LIMITER before each request."""
+
+    def send(self, request, **kwargs):
+        SEC_RATE_LIMITER.wait()
+        return super().send(request, **kwargs)
+
+
+# Shared SEC.gov session - reuses TCP/TLS connections across HEAD checks
+# and downloads instead of a fresh handshake per request. The zips are
+# already compressed, so ask for them as-is rather than gzip-wrapped.
+# SEC.gov answers clients over its rate limit with 403, so that is retried
+# with backoff like 429 rather than taken as a missing file
+SEC_SESSION = requests.Session()
+SEC_SESSION.mount("https://", RateLimitedAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=RateLimitedRetry(
+        total=5, backoff_factor=1, status_forcelist=[403, 429, 500, 502, 503, 504]
+    ),
+))
+SEC_SESSION.headers.update({"User-Agent": USER_AGENT, "Accept-Encoding": "identity"})
+
+# Bytes per read when writing downloads to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 # MinIO Configuration - loaded from .dlt/secrets.toml [sources.minio]
 # Defaults provided for backward compatibility
 MINIO_ENDPOINT = dlt.secrets.get("sources.minio.endpoint", "localhost:9000")
@@ -43,19 +126,73 @@ MINIO_BASE_PATH = dlt.secrets.get("sources.minio.base_path", "files")
 MINIO_USE_SSL = dlt.secrets.get("sources.minio.use_ssl", False)
 MINIO_REGION = dlt.secrets.get("sources.minio.region", "us-east-1")
 
+# Zips up to this size are buffered in memory when streamed straight from
+# SEC.gov; larger ones go to an anonymous temp file
+ZIP_SPOOL_MAX_SIZE = 512 * 1024 * 1024
+
+# Rows per Parquet row group in the staged files
+PARQUET_ROW_GROUP_SIZE = 1_000_000
+
+# Per-quarter scratch directories for TSV -> Parquet conversion live here.
+# One untouched for this long was left by a killed run and is removed
+SCRATCH_ROOT = Path(tempfile.gettempdir()) / "nport_extract"
+SCRATCH_MAX_AGE_SECONDS = 6 * 60 * 60
+
+# Marker object written once every table for a quarter has been uploaded
+SUCCESS_MARKER = "_SUCCESS"
+
+# Matches the completion marker of a staged quarter
+PARTITION_KEY_PATTERN = re.compile(rf"year=(\d{{4}})/quarter=(\d)/{SUCCESS_MARKER}$")
+
+# Number of TSV files converted and uploaded concurrently per quarter
+STAGE_WORKERS = 8
+
+# Multipart upload settings - 16MB parts are the smallest that avoid MinIO's
+# small-part degradation. Files of a quarter already upload concurrently, so
+# only a few parts of each file are in flight at once
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True,
+)
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
-def get_s3_client():
-    """Create boto3 S3 client configured for MinIO."""
+def get_s3_client(concurrent_quarters: int = 1, stage_workers: int = STAGE_WORKERS):
+    """
+    Create boto3 S3 client configured for MinIO.
+
+    The connection pool only bounds the sockets kept alive per client, not
+    the requests in flight, so it is sized to the actual upload fan-out:
+    quarters x files per quarter x parts per file. A smaller pool would
+    drop and reopen connections ("Connection pool is full").
+
+    Args:
+        concurrent_quarters: Quarters staged concurrently with this client
+        stage_workers: Files uploaded concurrently per quarter
+
+    Returns:
+        Boto3 S3 client
+    """
+    max_pool_connections = concurrent_quarters * stage_workers * TRANSFER_CONFIG.max_concurrency
+
     return boto3.client(
         's3',
         endpoint_url=f"http://{MINIO_ENDPOINT}" if not MINIO_USE_SSL else f"https://{MINIO_ENDPOINT}",
         aws_access_key_id=MINIO_ACCESS_KEY,
         aws_secret_access_key=MINIO_SECRET_KEY,
         region_name=MINIO_REGION,
-        config=Config(signature_version='s3v4'),
+        config=Config(
+            signature_version='s3v4',
+            s3={'addressing_style': 'path'},
+            max_pool_connections=max_pool_connections,
+            tcp_keepalive=True,
+            # Back off on MinIO SlowDown (503) when uploading quarters concurrently
+            retries={'max_attempts': 10, 'mode': 'adaptive'},
+        ),
     )
 
 
@@ -69,6 +206,12 @@ def download_quarterly_zip(year: int, quarter: int, download_dir: Path) -> Path:
     """
     Download N-PORT quarterly zip file from SEC.gov.
 
+    The download is written to a ``.part`` file and only renamed once
+    complete, so an existing zip is always a finished download. If a
+    previous attempt was interrupted, the transfer resumes with an HTTP
+    Range request guarded by the original ETag (If-Range), falling back
+    to a full download if the file changed on SEC.gov.
+
     Args:
         year: Year (e.g., 2024)
         quarter: Quarter (1-4)
@@ -79,97 +222,275 @@ def download_quarterly_zip(year: int, quarter: int, download_dir: Path) -> Path:
     """
     url = f"{SEC_BASE_URL}/{year}q{quarter}_nport.zip"
     zip_path = download_dir / f"{year}q{quarter}_nport.zip"
+    part_path = zip_path.with_name(zip_path.name + ".part")
+    etag_path = zip_path.with_name(zip_path.name + ".etag")
 
-    # SEC.gov requires User-Agent header
-    headers = {"User-Agent": USER_AGENT}
+    # SEC.gov requires User-Agent header (set on SEC_SESSION)
+    headers = {}
 
-    print(f"[*] Downloading: {url}")
-    response = requests.get(url, headers=headers, stream=True)
-    response.raise_for_status()
-
-    # Save zip file
-    with open(zip_path, 'wb') as f:
-        for chunk in response.iter_content(chunk_size=8192):
-            f.write(chunk)
+    # Resume a partial download if we know which version it came from
+    resume_from = 0
+    if part_path.exists() and etag_path.exists():
+        resume_from = part_path.stat().st_size
+        headers["Range"] = f"bytes={resume_from}-"
+        headers["If-Range"] = etag_path.read_text().strip()
 
-    file_size_mb = zip_path.stat().st_size / (1024 * 1024)
-    print(f"[+] Downloaded: {zip_path.name} ({file_size_mb:.1f} MB)")
+    print(f"[*] Downloading: {url}")
+    response = SEC_SESSION.get(url, headers=headers, stream=True, timeout=SEC_REQUEST_TIMEOUT)
+
+    if response.status_code == 416:
+        # Partial file already holds the whole object
+        print("[*] Partial download already complete")
+        size = resume_from
+    else:
+        response.raise_for_status()
+
+        if response.status_code == 206:
+            print(f"[*] Resuming download at {resume_from / (1024 * 1024):.1f} MB")
+            mode = 'ab'
+        else:
+            # Full response - remember the ETag so an interruption can resume
+            mode = 'wb'
+            etag = response.headers.get("ETag")
+            if etag:
+                etag_path.write_text(etag)
+            else:
+                etag_path.unlink(missing_ok=True)
+
+        # Save zip file
+        with open(part_path, mode) as f:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+            size = f.tell()
+
+    part_path.replace(zip_path)
+    etag_path.unlink(missing_ok=True)
+
+    print(f"[+] Downloaded: {zip_path.name} ({size / (1024 * 1024):.1f} MB)")
 
     return zip_path
 
 
-def extract_tsv_files(zip_path: Path, extract_dir: Path) -> list[Path]:
+def fetch_quarterly_zip(year: int, quarter: int) -> BinaryIO:
     """
-    Extract all TSV files from a zip archive.
+    Download N-PORT quarterly zip file from SEC.gov into a temporary buffer.
+
+    Zips up to ZIP_SPOOL_MAX_SIZE (by Content-Length) are held in memory;
+    larger ones, or ones without a Content-Length, go to an anonymous temp
+    file. Either way no named file is written and read back. Use
+    download_quarterly_zip instead when the zip should be kept.
 
     Args:
-        zip_path: Path to zip file
-        extract_dir: Directory to extract files to
+        year: Year (e.g., 2024)
+        quarter: Quarter (1-4)
 
     Returns:
-        List of extracted TSV file paths
+        Seekable binary file positioned at the start of the zip
     """
-    print(f"[*] Extracting: {zip_path.name}")
+    url = f"{SEC_BASE_URL}/{year}q{quarter}_nport.zip"
 
-    extracted_files = []
+    print(f"[*] Downloading: {url}")
+
+    with SEC_SESSION.get(url, stream=True, timeout=SEC_REQUEST_TIMEOUT) as response:
+        response.raise_for_status()
 
-    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-        for member in zip_ref.namelist():
-            if member.upper().endswith('.TSV'):
-                # Extract the file
-                zip_ref.extract(member, extract_dir)
-                file_path = extract_dir / member
+        # Not a SpooledTemporaryFile - zipfile can't read one before
+        # Python 3.11 (no seekable())
+        content_length = int(response.headers.get("Content-Length", 0))
+        if 0 < content_length <= ZIP_SPOOL_MAX_SIZE:
+            buffer = io.BytesIO()
+        else:
+            buffer = tempfile.TemporaryFile()
 
-                # Get file size
-                file_size_mb = file_path.stat().st_size / (1024 * 1024)
-                print(f"[+] Extracted: {member} ({file_size_mb:.1f} MB)")
+        response.raw.decode_content = True
+        shutil.copyfileobj(response.raw, buffer, length=DOWNLOAD_CHUNK_SIZE)
 
-                extracted_files.append(file_path)
+    size_mb = buffer.tell() / (1024 * 1024)
+    buffer.seek(0)
+    print(f"[+] Downloaded: {year}q{quarter}_nport.zip ({size_mb:.1f} MB)")
 
-    return extracted_files
+    return buffer
 
 
-def upload_to_minio(
-    file_path: Path,
+def convert_zip_member_to_parquet(
+    zip_ref: zipfile.ZipFile,
+    member: str,
     year: int,
     quarter: int,
-    s3_client
+    s3_client,
+    con: duckdb.DuckDBPyConnection,
+    work_dir: Path
 ) -> str:
     """
-    Upload TSV file to MinIO in Hive-partitioned structure.
+    Re-encode a single TSV member from a zip archive as Parquet in MinIO.
+
+    The TSV is parsed once here, typed from TABLE_SCHEMAS, and written as
+    ZSTD-compressed Parquet so the load pipeline never parses CSV again.
 
     Args:
-        file_path: Local path to TSV file
+        zip_ref: Open zip archive
+        member: Name of the TSV member inside the zip
         year: Year for Hive partition
         quarter: Quarter for Hive partition
         s3_client: Boto3 S3 client
+        con: DuckDB connection (a cursor per thread)
+        work_dir: Scratch directory for the TSV and Parquet files
 
     Returns:
         S3 key where file was uploaded
     """
-    # Construct S3 key with Hive partitioning
-    # Format: files/year=YYYY/quarter=Q/TABLE_NAME.tsv
-    table_name = file_path.name
-    s3_key = f"{MINIO_BASE_PATH}/year={year}/quarter={quarter}/{table_name}"
-
-    # Upload file
-    file_size_mb = file_path.stat().st_size / (1024 * 1024)
-    print(f"[*] Uploading {table_name} to s3://{MINIO_BUCKET}/{s3_key} ({file_size_mb:.1f} MB)")
-
-    s3_client.upload_file(
-        str(file_path),
-        MINIO_BUCKET,
-        s3_key
-    )
+    table_file = Path(member).name
+    parquet_name = f"{Path(table_file).stem}.parquet"
+    s3_key = f"{MINIO_BASE_PATH}/year={year}/quarter={quarter}/{parquet_name}"
+
+    tsv_path = work_dir / table_file
+    parquet_path = work_dir / parquet_name
 
-    print(f"[+] Uploaded: {s3_key}")
+    # Scratch files are removed as soon as each is used (and on failure),
+    # so local disk only ever holds the files currently being converted
+    try:
+        with zip_ref.open(member) as src, open(tsv_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, length=1024 * 1024)
+
+        # Only type the columns this quarter's file actually has - older
+        # quarters predate some columns in the current SEC schema
+        with open(tsv_path, 'rb') as f:
+            header = set(f.readline().decode("utf-8").rstrip("\r\n").split("\t"))
+        column_types = {
+            name: type_
+            for name, type_ in TABLE_SCHEMAS.get(table_file, {}).items()
+            if name in header
+        }
+        types_sql = ", ".join(f"'{name}': '{type_}'" for name, type_ in column_types.items())
+        types_option = f"types={{{types_sql}}}," if column_types else ""
+
+        # Default max_line_size and parallel=true keep DuckDB on its parallel
+        # CSV reader. The old 10MB override was a workaround for sample_size=-1
+        # concatenating multi-file samples, which can't happen for one local file
+        con.execute(f"""
+            COPY (
+                SELECT * FROM read_csv(
+                    '{tsv_path.as_posix()}',
+                    delim='\\t',
+                    header=true,
+                    sample_size=20000,
+                    new_line='\\n',
+                    parallel=true,
+                    {types_option}
+                    dateformat='{TSV_DATE_FORMAT}'
+                )
+            ) TO '{parquet_path.as_posix()}'
+            (FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE {PARQUET_ROW_GROUP_SIZE})
+        """)
+        tsv_path.unlink()
+
+        s3_client.upload_file(
+            str(parquet_path),
+            MINIO_BUCKET,
+            s3_key,
+            Config=TRANSFER_CONFIG
+        )
+    finally:
+        tsv_path.unlink(missing_ok=True)
+        parquet_path.unlink(missing_ok=True)
 
     return s3_key
 
 
+def clean_stale_scratch_dirs() -> None:
+    """
+    Remove scratch directories left behind by killed runs.
+
+    A live conversion creates and deletes files in its directory all the
+    time, so only directories untouched for SCRATCH_MAX_AGE_SECONDS go.
+    """
+    if not SCRATCH_ROOT.exists():
+        return
+
+    cutoff = time.time() - SCRATCH_MAX_AGE_SECONDS
+    for path in SCRATCH_ROOT.iterdir():
+        try:
+            stale = path.stat().st_mtime < cutoff
+        except FileNotFoundError:
+            continue
+        if stale:
+            print(f"[*] Removing stale scratch directory: {path}")
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def stage_quarter_to_minio(
+    zip_source: Union[Path, BinaryIO],
+    year: int,
+    quarter: int,
+    s3_client,
+    max_workers: int = STAGE_WORKERS,
+    con: Optional[duckdb.DuckDBPyConnection] = None
+) -> list[str]:
+    """
+    Convert all TSV files in a zip archive to Parquet and upload to MinIO.
+
+    Args:
+        zip_source: Path to zip file, or a seekable binary file holding it
+        year: Year for Hive partition
+        quarter: Quarter for Hive partition
+        s3_client: Boto3 S3 client
+        max_workers: Number of TSV files converted concurrently
+        con: DuckDB connection to convert with. Pass one shared connection
+            when staging quarters concurrently, so they share one memory
+            limit and thread pool instead of each sizing itself to the
+            whole machine. Defaults to a connection for this quarter only
+
+    Returns:
+        List of S3 keys where files were uploaded
+    """
+    clean_stale_scratch_dirs()
+    SCRATCH_ROOT.mkdir(parents=True, exist_ok=True)
+
+    # Members are read concurrently from one archive - zipfile serializes
+    # the underlying reads with a lock, while decompression and DuckDB's
+    # conversion run in parallel
+    with contextlib.ExitStack() as stack:
+        if con is None:
+            con = stack.enter_context(duckdb.connect(':memory:'))
+        zip_ref = stack.enter_context(zipfile.ZipFile(zip_source, 'r'))
+        work_dir = Path(stack.enter_context(
+            tempfile.TemporaryDirectory(prefix=f"nport_{year}q{quarter}_", dir=SCRATCH_ROOT)
+        ))
+
+        members = [info for info in zip_ref.infolist() if info.filename.upper().endswith('.TSV')]
+
+        def convert(member: zipfile.ZipInfo) -> str:
+            with con.cursor() as cursor:
+                return convert_zip_member_to_parquet(
+                    zip_ref, member.filename, year, quarter, s3_client, cursor, work_dir
+                )
+
+        print(f"[*] Converting {len(members)} TSV files to Parquet for {year} Q{quarter}")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            uploaded_keys = list(executor.map(convert, members))
+
+    # Only mark the quarter complete once every file is in place
+    s3_client.put_object(Bucket=MINIO_BUCKET, Key=success_marker_key(year, quarter), Body=b"")
+
+    # Sizes come from the zip directory, so there's nothing to stat
+    tsv_size_mb = sum(member.file_size for member in members) / (1024 * 1024)
+    print(f"[+] Staged {len(uploaded_keys)} tables for {year} Q{quarter} ({tsv_size_mb:.1f} MB of TSV)")
+
+    return uploaded_keys
+
+
+def success_marker_key(year: int, quarter: int) -> str:
+    """S3 key of the completion marker for a quarter."""
+    return f"{MINIO_BASE_PATH}/year={year}/quarter={quarter}/{SUCCESS_MARKER}"
+
+
 def check_quarter_exists_in_minio(year: int, quarter: int, s3_client) -> bool:
     """
-    Check if a quarter's data already exists in MinIO.
+    Check if a quarter's data has been fully staged in MinIO.
+
+    Looks for the quarter's _SUCCESS marker with a single HEAD request, so
+    a partially uploaded quarter is not mistaken for a complete one.
 
     Args:
         year: Year to check
@@ -179,18 +500,35 @@ def check_quarter_exists_in_minio(year: int, quarter: int, s3_client) -> bool:
     Returns:
         True if quarter data exists, False otherwise
     """
-    prefix = f"{MINIO_BASE_PATH}/year={year}/quarter={quarter}/"
-
     try:
-        response = s3_client.list_objects_v2(
-            Bucket=MINIO_BUCKET,
-            Prefix=prefix,
-            MaxKeys=1
-        )
-        return 'Contents' in response and len(response['Contents']) > 0
-    except Exception as e:
-        print(f"[!] Error checking MinIO: {e}")
-        return False
+        s3_client.head_object(Bucket=MINIO_BUCKET, Key=success_marker_key(year, quarter))
+        return True
+    except ClientError as e:
+        if e.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+            return False
+        raise
+
+
+def load_existing_partitions(s3_client) -> set[tuple[int, int]]:
+    """
+    List all quarters already staged in MinIO with a single paginated LIST.
+
+    Args:
+        s3_client: Boto3 S3 client
+
+    Returns:
+        Set of (year, quarter) tuples that have a _SUCCESS marker
+    """
+    existing = set()
+
+    paginator = s3_client.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=MINIO_BUCKET, Prefix=f"{MINIO_BASE_PATH}/"):
+        for obj in page.get('Contents', []):
+            match = PARTITION_KEY_PATTERN.search(obj['Key'])
+            if match:
+                existing.add((int(match.group(1)), int(match.group(2))))
+
+    return existing
 
 
 # =============================================================================
@@ -214,6 +552,7 @@ def nport_sec_gov_extract_source(year: int, quarter: int, skip_if_exists: bool =
     @dlt.resource(
         name="extract_metadata",
         write_disposition="append",
+        parallelized=True,
     )
     def extract_quarter():
         """
@@ -235,53 +574,37 @@ def nport_sec_gov_extract_source(year: int, quarter: int, skip_if_exists: bool =
             }
             return
 
-        # Create temp directories
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            download_dir = temp_path / "downloads"
-            extract_dir = temp_path / "extracted"
-            download_dir.mkdir()
-            extract_dir.mkdir()
-
-            try:
-                # Step 1: Download zip
-                print(f"\n[1/3] Downloading {year} Q{quarter}")
-                zip_path = download_quarterly_zip(year, quarter, download_dir)
-
-                # Step 2: Extract TSV files
-                print(f"\n[2/3] Extracting TSV files")
-                tsv_files = extract_tsv_files(zip_path, extract_dir)
-
-                # Step 3: Upload to MinIO
-                print(f"\n[3/3] Uploading to MinIO")
-                uploaded_keys = []
-                for tsv_file in tsv_files:
-                    s3_key = upload_to_minio(tsv_file, year, quarter, s3_client)
-                    uploaded_keys.append(s3_key)
-
-                print(f"\n[+] Successfully staged {len(uploaded_keys)} files for {year} Q{quarter}")
-
-                # Yield metadata
-                yield {
-                    "year": year,
-                    "quarter": quarter,
-                    "as_at_date": quarter_to_date(year, quarter),
-                    "status": "success",
-                    "files_uploaded": len(uploaded_keys),
-                    "s3_keys": uploaded_keys
-                }
-
-            except Exception as e:
-                print(f"\n[!] ERROR: Failed to extract {year} Q{quarter}: {e}")
-                yield {
-                    "year": year,
-                    "quarter": quarter,
-                    "as_at_date": quarter_to_date(year, quarter),
-                    "status": "failed",
-                    "error": str(e),
-                    "files_uploaded": 0
-                }
-                raise
+        try:
+            # Step 1: Download zip into a temporary buffer (no named temp file)
+            print(f"\n[1/2] Downloading {year} Q{quarter}")
+            with fetch_quarterly_zip(year, quarter) as zip_buffer:
+                # Step 2: Convert TSV files to Parquet and upload to MinIO
+                print(f"\n[2/2] Staging Parquet files to MinIO")
+                uploaded_keys = stage_quarter_to_minio(zip_buffer, year, quarter, s3_client)
+
+            print(f"\n[+] Successfully staged {len(uploaded_keys)} files for {year} Q{quarter}")
+
+            # Yield metadata
+            yield {
+                "year": year,
+                "quarter": quarter,
+                "as_at_date": quarter_to_date(year, quarter),
+                "status": "success",
+                "files_uploaded": len(uploaded_keys),
+                "s3_keys": uploaded_keys
+            }
+
+        except Exception as e:
+            print(f"\n[!] ERROR: Failed to extract {year} Q{quarter}: {e}")
+            yield {
+                "year": year,
+                "quarter": quarter,
+                "as_at_date": quarter_to_date(year, quarter),
+                "status": "failed",
+                "error": str(e),
+                "files_uploaded": 0
+            }
+            raise
 
     return extract_quarter()
 
@@ -6,15 +6,18 @@ Pipeline 2 of 2: Loads N-PORT data from MinIO S3-compatible storage using
 DuckDB bulk reads with glob patterns.
 
 This pipeline:
-1. Reads TSV files from MinIO using DuckDB's S3 integration
+1. Reads staged Parquet files from MinIO using DuckDB's S3 integration
 2. Uses glob patterns to read multiple quarters efficiently
-3. Applies store_rejects pattern for production error handling
-4. Adds _as_at_date partition column based on Hive partitions
+3. Adds _as_at_date partition column based on Hive partitions
 
 The data must first be staged by the companion pipeline:
 nport_extract_to_minio.py
 """
 
+import functools
+import os
+import threading
+from collections import Counter
 import dlt
 import duckdb
 from pathlib import Path
@@ -65,6 +68,15 @@ try:
 except KeyError:
     MINIO_REGION = "us-east-1"
 
+# Rows per Arrow record batch streamed from DuckDB to dlt
+ARROW_BATCH_ROWS = 100_000
+
+# Resources yield Arrow batches, which dlt writes straight to Parquet at
+# extract time; loading that Parquet as-is skips any re-encode in normalize.
+# Only for destinations that load Parquet directly - others (e.g. databricks,
+# which needs a staging bucket for Parquet) keep dlt's default format
+PARQUET_DESTINATIONS = ("duckdb", "ducklake")
+
 # Table mappings (TSV filename -> DLT table name)
 TABLE_MAPPINGS = {
     "SUBMISSION.tsv": "submission",
@@ -98,6 +110,9 @@ TABLE_MAPPINGS = {
     "EXPLANATORY_NOTE.tsv": "explanatory_note",
 }
 
+# Reverse lookup (DLT table name -> TSV filename)
+INVERSE_TABLE_MAPPINGS = {v: k for k, v in TABLE_MAPPINGS.items()}
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -109,34 +124,115 @@ def configure_duckdb_for_minio(con: duckdb.DuckDBPyConnection):
     Args:
         con: DuckDB connection to configure
     """
-    # Install and load httpfs extension for S3 access
-    con.execute("INSTALL httpfs;")
-    con.execute("LOAD httpfs;")
-
-    # Configure S3 settings for MinIO
-    con.execute(f"SET s3_endpoint='{MINIO_ENDPOINT}';")
-    con.execute(f"SET s3_access_key_id='{MINIO_ACCESS_KEY}';")
-    con.execute(f"SET s3_secret_access_key='{MINIO_SECRET_KEY}';")
-    con.execute(f"SET s3_use_ssl={'true' if MINIO_USE_SSL else 'false'};")
-    con.execute(f"SET s3_url_style='path';")
-    con.execute(f"SET s3_region='{MINIO_REGION}';")
+    # One script, one round trip:
+    # - load httpfs for S3 access
+    # - register the MinIO credentials as a secret scoped to the bucket, so
+    #   it never shadows other S3 secrets on a shared destination connection
+    #   (secrets live on the database instance, so cursors see them too)
+    # - HTTP tuning: reuse connections across range GETs, cache HEAD/metadata
+    #   lookups between the glob listing and the scans, and ride out MinIO
+    #   hiccups on long reads instead of failing the whole table
+    con.execute(f"""
+        INSTALL httpfs;
+        LOAD httpfs;
+
+        CREATE OR REPLACE SECRET nport_minio (
+            TYPE s3,
+            KEY_ID '{MINIO_ACCESS_KEY}',
+            SECRET '{MINIO_SECRET_KEY}',
+            ENDPOINT '{MINIO_ENDPOINT}',
+            REGION '{MINIO_REGION}',
+            URL_STYLE 'path',
+            USE_SSL {'true' if MINIO_USE_SSL else 'false'},
+            SCOPE 's3://{MINIO_BUCKET}'
+        );
+
+        SET GLOBAL http_keep_alive=true;
+        SET GLOBAL enable_http_metadata_cache=true;
+        SET GLOBAL http_retries=5;
+        SET GLOBAL http_retry_backoff=4;
+    """)
 
     print(f"[+] DuckDB configured for MinIO at {MINIO_ENDPOINT}")
 
 
+_shared_connection = None
+_shared_connection_lock = threading.Lock()
+
+
+def get_shared_connection() -> duckdb.DuckDBPyConnection:
+    """
+    Return the process-wide DuckDB connection, configured once for MinIO.
+
+    Table resources each take a cursor() from it - cursors are safe to use
+    from separate threads and share the loaded httpfs extension and S3
+    settings, so there is no per-table connect/INSTALL/SET cost.
+
+    Returns:
+        Shared in-memory DuckDB connection
+    """
+    global _shared_connection
+
+    with _shared_connection_lock:
+        if _shared_connection is None:
+            con = duckdb.connect(':memory:')
+            configure_duckdb_for_minio(con)
+            con.execute(f"SET threads TO {os.cpu_count()};")
+            _shared_connection = con
+
+    return _shared_connection
+
+
 def quarter_to_date(year: int, quarter: int) -> str:
     """Convert year/quarter to quarter-end date string."""
     quarter_ends = {1: "03-31", 2: "06-30", 3: "09-30", 4: "12-31"}
     return f"{year}-{quarter_ends[quarter]}"
 
 
+def get_loader_file_format(destination: str) -> Optional[str]:
+    """
+    Pick the loader file format for a destination.
+
+    Args:
+        destination: DLT destination name
+
+    Returns:
+        "parquet" for destinations in PARQUET_DESTINATIONS, otherwise None
+        so dlt uses the destination's default
+    """
+    return "parquet" if destination in PARQUET_DESTINATIONS else None
+
+
+def get_s3_path_for_stem(
+    table_stem: str,
+    year: Optional[int] = None,
+    quarter: Optional[int] = None
+) -> str:
+    """
+    Construct S3 path with glob pattern for staged Parquet files by name.
+
+    Args:
+        table_stem: Staged file name without extension (e.g., "SUBMISSION"),
+            or a glob such as "*"
+        year: Specific year, or None for all years
+        quarter: Specific quarter, or None for all quarters
+
+    Returns:
+        S3 path with glob pattern
+    """
+    year_part = f"year={year}" if year else "year=*"
+    quarter_part = f"quarter={quarter}" if quarter else "quarter=*"
+
+    return f"s3://{MINIO_BUCKET}/{MINIO_BASE_PATH}/{year_part}/{quarter_part}/{table_stem}.parquet"
+
+
 def get_s3_path_for_table(
     table_file: str,
     year: Optional[int] = None,
     quarter: Optional[int] = None
 ) -> str:
     """
-    Construct S3 path with glob pattern for a table.
+    Construct S3 path with glob pattern for a table's staged Parquet files.
 
     Args:
         table_file: TSV filename (e.g., "SUBMISSION.tsv")
@@ -146,10 +242,80 @@ def get_s3_path_for_table(
     Returns:
         S3 path with glob pattern
     """
-    year_part = f"year={year}" if year else "year=*"
-    quarter_part = f"quarter={quarter}" if quarter else "quarter=*"
+    return get_s3_path_for_stem(Path(table_file).stem, year, quarter)
+
+
+def build_table_query(
+    s3_path: str,
+    year: Optional[int] = None,
+    quarter: Optional[int] = None
+) -> str:
+    """
+    Build the DuckDB SELECT that reads a table's staged Parquet from MinIO.
+
+    Shared by the dlt resource and the direct DuckDB bulk-load path so both
+    produce identical bronze tables.
+
+    Args:
+        s3_path: S3 path with glob pattern (see get_s3_path_for_table)
+        year: Specific year the path is pinned to, or None
+        quarter: Specific quarter the path is pinned to, or None
+
+    Returns:
+        SQL query string
+    """
+    # _as_at_date is the quarter-end date. For a single quarter it's a
+    # constant DuckDB folds away; otherwise derive it arithmetically from
+    # the Hive partition columns (no per-row string building or parsing)
+    if year and quarter:
+        as_at_date_expr = f"DATE '{quarter_to_date(year, quarter)}'"
+    else:
+        as_at_date_expr = "last_day(make_date(CAST(year AS INTEGER), CAST(quarter AS INTEGER) * 3, 1))"
+
+    # Read from S3 using DuckDB with Hive partitioning
+    # DuckDB will automatically extract year= and quarter= from paths
+    # union_by_name handles schema evolution across quarters
+    # Column types were fixed when the extract pipeline wrote the Parquet,
+    # so there is no CSV parsing or type sniffing here
+    query = f"""
+        SELECT
+            *,
+            {as_at_date_expr} as _as_at_date
+        FROM read_parquet(
+            '{s3_path}',
+            hive_partitioning=true,
+            union_by_name=true
+        )
+    """
+
+    return query
 
-    return f"s3://{MINIO_BUCKET}/{MINIO_BASE_PATH}/{year_part}/{quarter_part}/{table_file}"
+
+@functools.lru_cache(maxsize=None)
+def list_staged_files(year: Optional[int] = None, quarter: Optional[int] = None) -> dict[str, int]:
+    """
+    List staged tables once per (year, quarter) filter.
+
+    One glob over the whole partition range replaces a separate S3 LIST per
+    table; results are cached for the life of the process.
+
+    Args:
+        year: Specific year, or None for all years
+        quarter: Specific quarter, or None for all quarters
+
+    Returns:
+        Mapping of TSV filename -> number of partitions containing it
+    """
+    s3_path = get_s3_path_for_stem("*", year, quarter)
+
+    con = get_shared_connection().cursor()
+    try:
+        rows = con.execute(f"SELECT file FROM glob('{s3_path}')").fetchall()
+    finally:
+        con.close()
+
+    # Keyed by the TSV filename the tables are mapped under
+    return dict(Counter(f"{Path(file).stem}.tsv" for (file,) in rows))
 
 
 # =============================================================================
@@ -184,6 +350,7 @@ def nport_minio_source(
             continue
 
         table_name = TABLE_MAPPINGS[table_file]
+
         resources.append(create_table_resource(table_file, table_name, year, quarter))
 
     return resources
@@ -211,6 +378,7 @@ def create_table_resource(
     @dlt.resource(
         name=table_name,
         write_disposition="append",
+        parallelized=True,
         columns={
             "_as_at_date": {
                 "data_type": "date",
@@ -222,71 +390,20 @@ def create_table_resource(
     def _resource():
         """
         Load table from MinIO using DuckDB with glob patterns.
-        Uses store_rejects for production-ready error handling.
         """
         # Construct S3 path with glob pattern
         s3_path = get_s3_path_for_table(table_file, year, quarter)
 
         print(f"[*] Loading {table_name} from {s3_path}")
 
-        # Create DuckDB connection
-        con = duckdb.connect(':memory:')
-
-        # Configure for MinIO
-        configure_duckdb_for_minio(con)
-
-        # rejects_table = f"{table_name}_rejects"
-
-        # Read from S3 using DuckDB with Hive partitioning
-        # DuckDB will automatically extract year= and quarter= from paths
-        # union_by_name handles schema evolution across quarters
-        # NOTE: store_rejects is NOT compatible with union_by_name in DuckDB
-        #       If you encounter file errors, you may need to disable union_by_name
-        #       and process quarters separately with store_rejects enabled
-        #
-        # IMPORTANT: sample_size=20000 (not -1)
-        #   - sample_size=-1 means "sample entire dataset for schema detection"
-        #   - When reading multiple files with glob patterns, sample_size=-1 causes
-        #     DuckDB to incorrectly concatenate file samples, breaking newline detection
-        #   - This resulted in "Maximum line size exceeded" errors (147MB "line")
-        #   - sample_size=20000 provides sufficient sampling for accurate schema detection
-        #     while avoiding the multi-file concatenation bug
-        #   - Tested successfully with 23 quarters (149M+ rows) of IDENTIFIERS data
-        query = f"""
-            SELECT
-                *,
-                CAST(
-                    CASE quarter
-                        WHEN 1 THEN year || '-03-31'
-                        WHEN 2 THEN year || '-06-30'
-                        WHEN 3 THEN year || '-09-30'
-                        WHEN 4 THEN year || '-12-31'
-                    END AS DATE
-                ) as _as_at_date
-            FROM read_csv_auto(
-                '{s3_path}',
-                delim='\\t',
-                header=true,
-                sample_size=20000,
-                new_line='\\n',
-                max_line_size=10000000,
-                hive_partitioning=true,
-                union_by_name=true
-                -- store_rejects NOT compatible with union_by_name
-                -- store_rejects=true,
-                -- rejects_table='table_name_rejects',
-                -- rejects_limit=1000000
-            )
-        """
+        # Cursor on the shared, already-configured connection
+        con = get_shared_connection().cursor()
+
+        query = build_table_query(s3_path, year, quarter)
 
         try:
-            # Check if any files match the pattern first
-            check_query = f"""
-                SELECT COUNT(*) as file_count
-                FROM glob('{s3_path}')
-            """
-            file_count_result = con.execute(check_query).fetchone()
-            file_count = file_count_result[0] if file_count_result else 0
+            # Check if any files match the pattern first (cached listing)
+            file_count = list_staged_files(year, quarter).get(table_file, 0)
 
             if file_count == 0:
                 print(f"[*] No files found for {table_name} at {s3_path} - table may not exist in these quarters")
@@ -295,20 +412,20 @@ def create_table_resource(
 
             print(f"[*] Found {file_count} file(s) matching pattern")
 
-            arrow_table = con.execute(query).fetch_arrow_table()
-            row_count = len(arrow_table)
-
-            # Reject checking disabled when using union_by_name
-            # (store_rejects is incompatible with union_by_name)
-            # If you encounter errors, consider disabling union_by_name and
-            # processing quarters individually with store_rejects enabled
+            # Row order doesn't matter for bronze - lets DuckDB stream
+            # batches from its parallel scan without re-ordering them
+            con.execute("SET preserve_insertion_order=false;")
 
-            print(f"[+] Loaded {row_count:,} rows from {table_name}")
+            # Stream Arrow record batches so peak memory is one batch,
+            # not the whole table (IDENTIFIERS alone is 149M+ rows)
+            reader = con.execute(query).fetch_record_batch(rows_per_batch=ARROW_BATCH_ROWS)
+            row_count = 0
 
-            # Note: Any row-level errors will cause the entire load to fail
-            # This is a tradeoff for supporting schema evolution with union_by_name
+            for batch in reader:
+                row_count += batch.num_rows
+                yield batch
 
-            yield arrow_table
+            print(f"[+] Loaded {row_count:,} rows from {table_name}")
 
         except Exception as e:
             print(f"[!] ERROR loading {table_name}: {e}")
@@ -365,7 +482,7 @@ if __name__ == "__main__":
     )
 
     # Run pipeline
-    load_info = pipeline.run(source)
+    load_info = pipeline.run(source, loader_file_format=get_loader_file_format(args.destination))
 
     print("\n" + "="*80)
     print("LOAD COMPLETE")
@@ -0,0 +1,355 @@
+"""
+N-PORT Table Schemas
+====================
+
+Column -> DuckDB type for each N-PORT TSV, generated once from the SEC
+CSVW metadata shipped with the data sets (data/nport/nport_metadata.json).
+
+Type mapping:
+- string             -> VARCHAR
+- date (DD-MON-YYYY) -> DATE (read with TSV_DATE_FORMAT)
+- NUMBER(p, 0)       -> BIGINT
+- NUMBER(p, s)       -> DECIMAL(p, s)
+
+Used by nport_extract_to_minio.py to type the Parquet files it stages, so
+neither pipeline relies on DuckDB's type sniffing.
+"""
+
+# Date format used by every DATE column in the N-PORT TSVs (e.g. 30-OCT-2024)
+TSV_DATE_FORMAT = "%d-%b-%Y"
+
+# TSV filename -> {column name -> DuckDB type}
+TABLE_SCHEMAS: dict[str, dict[str, str]] = {
+    "SUBMISSION.tsv": {
+        "ACCESSION_NUMBER": "VARCHAR",
+        "FILING_DATE": "DATE",
+        "FILE_NUM": "VARCHAR",
+        "SUB_TYPE": "VARCHAR",
+        "REPORT_ENDING_PERIOD": "DATE",
+        "REPORT_DATE": "DATE",
+        "IS_LAST_FILING": "VARCHAR",
+    },
+    "REGISTRANT.tsv": {
+        "ACCESSION_NUMBER": "VARCHAR",
+        "CIK": "VARCHAR",
+        "REGISTRANT_NAME": "VARCHAR",
+        "FILE_NUM": "VARCHAR",
+        "LEI": "VARCHAR",
+        "ADDRESS1": "VARCHAR",
+        "ADDRESS2": "VARCHAR",
+        "CITY": "VARCHAR",
+        "STATE": "VARCHAR",
+        "COUNTRY": "VARCHAR",
+        "ZIP": "VARCHAR",
+        "PHONE": "VARCHAR",
+    },
+    "FUND_REPORTED_INFO.tsv": {
+        "ACCESSION_NUMBER": "VARCHAR",
+        "SERIES_NAME": "VARCHAR",
+        "SERIES_ID": "VARCHAR",
+        "SERIES_LEI": "VARCHAR",
+        "TOTAL_ASSETS": "DECIMAL(36,12)",
+        "TOTAL_LIABILITIES": "DECIMAL(36,12)",
+        "NET_ASSETS": "DECIMAL(36,12)",
+        "ASSETS_ATTRBT_TO_MISC_SECURITY": "DECIMAL(36,12)",
+        "ASSETS_INVESTED": "DECIMAL(36,12)",
+        "BORROWING_PAY_WITHIN_1YR": "DECIMAL(36,12)",
+        "CTRLD_COMPANIES_PAY_WITHIN_1YR": "DECIMAL(36,12)",
+        "OTHER_AFFILIA_PAY_WITHIN_1YR": "DECIMAL(36,12)",
+        "OTHER_PAY_WITHIN_1YR": "DECIMAL(36,12)",
+        "BORROWING_PAY_AFTER_1YR": "DECIMAL(36,12)",
+        "CTRLD_COMPANIES_PAY_AFTER_1YR": "DECIMAL(36,12)",
+        "OTHER_AFFILIA_PAY_AFTER_1YR": "DECIMAL(36,12)",
+        "OTHER_PAY_AFTER_1YR": "DECIMAL(36,12)",
+        "DELAYED_DELIVERY": "DECIMAL(36,12)",
+        "STANDBY_COMMITMENT": "DECIMAL(36,12)",
+        "LIQUIDATION_PREFERENCE": "DECIMAL(36,12)",
+        "CASH_NOT_RPTD_IN_C_OR_D": "DECIMAL(36,12)",
+        "CREDIT_SPREAD_3MON_INVEST": "DECIMAL(36,12)",
+        "CREDIT_SPREAD_1YR_INVEST": "DECIMAL(36,12)",
+        "CREDIT_SPREAD_5YR_INVEST": "DECIMAL(36,12)",
+        "CREDIT_SPREAD_10YR_INVEST": "DECIMAL(36,12)",
+        "CREDIT_SPREAD_30YR_INVEST": "DECIMAL(36,12)",
+        "CREDIT_SPREAD_3MON_NONINVEST": "DECIMAL(36,12)",
+        "CREDIT_SPREAD_1YR_NONINVEST": "DECIMAL(36,12)",
+        "CREDIT_SPREAD_5YR_NONINVEST": "DECIMAL(36,12)",
+        "CREDIT_SPREAD_10YR_NONINVEST": "DECIMAL(36,12)",
+        "CREDIT_SPREAD_30YR_NONINVEST": "DECIMAL(36,12)",
+        "IS_NON_CASH_COLLATERAL": "VARCHAR",
+        "NET_REALIZE_GAIN_NONDERIV_MON1": "DECIMAL(36,12)",
+        "NET_UNREALIZE_AP_NONDERIV_MON1": "DECIMAL(36,12)",
+        "NET_REALIZE_GAIN_NONDERIV_MON2": "DECIMAL(36,12)",
+        "NET_UNREALIZE_AP_NONDERIV_MON2": "DECIMAL(36,12)",
+        "NET_REALIZE_GAIN_NONDERIV_MON3": "DECIMAL(36,12)",
+        "NET_UNREALIZE_AP_NONDERIV_MON3": "DECIMAL(36,12)",
+        "SALES_FLOW_MON1": "DECIMAL(36,12)",
+        "REINVESTMENT_FLOW_MON1": "DECIMAL(36,12)",
+        "REDEMPTION_FLOW_MON1": "DECIMAL(36,12)",
+        "SALES_FLOW_MON2": "DECIMAL(36,12)",
+        "REINVESTMENT_FLOW_MON2": "DECIMAL(36,12)",
+        "REDEMPTION_FLOW_MON2": "DECIMAL(36,12)",
+        "SALES_FLOW_MON3": "DECIMAL(36,12)",
+        "REINVESTMENT_FLOW_MON3": "DECIMAL(36,12)",
+        "REDEMPTION_FLOW_MON3": "DECIMAL(36,12)",
+    },
+    "INTEREST_RATE_RISK.tsv": {
+        "ACCESSION_NUMBER": "VARCHAR",
+        "INTEREST_RATE_RISK_ID": "BIGINT",
+        "CURRENCY_CODE": "VARCHAR",
+        "INTRST_RATE_CHANGE_3MON_DV01": "DECIMAL(36,12)",
+        "INTRST_RATE_CHANGE_1YR_DV01": "DECIMAL(36,12)",
+        "INTRST_RATE_CHANGE_5YR_DV01": "DECIMAL(36,12)",
+        "INTRST_RATE_CHANGE_10YR_DV01": "DECIMAL(36,12)",
+        "INTRST_RATE_CHANGE_30YR_DV01": "DECIMAL(36,12)",
+        "INTRST_RATE_CHANGE_3MON_DV100": "DECIMAL(36,12)",
+        "INTRST_RATE_CHANGE_1YR_DV100": "DECIMAL(36,12)",
+        "INTRST_RATE_CHANGE_5YR_DV100": "DECIMAL(36,12)",
+        "INTRST_RATE_CHANGE_10YR_DV100": "DECIMAL(36,12)",
+        "INTRST_RATE_CHANGE_30YR_DV100": "DECIMAL(36,12)",
+    },
+    "BORROWER.tsv": {
+        "ACCESSION_NUMBER": "VARCHAR",
+        "BORROWER_ID": "BIGINT",
+        "NAME": "VARCHAR",
+        "LEI": "VARCHAR",
+        "AGGREGATE_VALUE": "DECIMAL(36,12)",
+    },
+    "BORROW_AGGREGATE.tsv": {
+        "ACCESSION_NUMBER": "VARCHAR",
+        "BORROW_AGGREGATE_ID": "BIGINT",
+        "AMOUNT": "DECIMAL(36,12)",
+        "COLLATERAL": "DECIMAL(36,12)",
+        "INVESTMENT_CAT": "VARCHAR",
+        "OTHER_DESC": "VARCHAR",
+    },
+    "MONTHLY_TOTAL_RETURN.tsv": {
+        "ACCESSION_NUMBER": "VARCHAR",
+        "MONTHLY_TOTAL_RETURN_ID": "BIGINT",
+        "CLASS_ID": "VARCHAR",
+        "MONTHLY_TOTAL_RETURN1": "DECIMAL(36,12)",
+        "MONTHLY_TOTAL_RETURN2": "DECIMAL(36,12)",
+        "MONTHLY_TOTAL_RETURN3": "DECIMAL(36,12)",
+    },
+    "MONTHLY_RETURN_CAT_INSTRUMENT.tsv": {
+        "ACCESSION_NUMBER": "VARCHAR",
+        "ASSET_CAT": "VARCHAR",
+        "INSTRUMENT_KIND": "VARCHAR",
+        "NET_REALIZED_GAIN_MON1": "DECIMAL(36,12)",
+        "NET_UNREALIZED_AP_MON1": "DECIMAL(36,12)",
+        "NET_REALIZED_GAIN_MON2": "DECIMAL(36,12)",
+        "NET_UNREALIZED_AP_MON2": "DECIMAL(36,12)",
+        "NET_REALIZED_GAIN_MON3": "DECIMAL(36,12)",
+        "NET_UNREALIZED_AP_MON3": "DECIMAL(36,12)",
+    },
+    "FUND_REPORTED_HOLDING.tsv": {
+        "ACCESSION_NUMBER": "VARCHAR",
+        "HOLDING_ID": "BIGINT",
+        "ISSUER_NAME": "VARCHAR",
+        "ISSUER_LEI": "VARCHAR",
+        "ISSUER_TITLE": "VARCHAR",
+        "ISSUER_CUSIP": "VARCHAR",
+        "BALANCE": "DECIMAL(36,12)",
+        "UNIT": "VARCHAR",
+        "OTHER_UNIT_DESC": "VARCHAR",
+        "CURRENCY_CODE": "VARCHAR",
+        "CURRENCY_VALUE": "DECIMAL(36,12)",
+        "EXCHANGE_RATE": "DECIMAL(36,12)",
+        "PERCENTAGE": "DECIMAL(36,12)",
+        "PAYOFF_PROFILE": "VARCHAR",
+        "ASSET_CAT": "VARCHAR",
+        "OTHER_ASSET": "VARCHAR",
+        "ISSUER_TYPE": "VARCHAR",
+        "OTHER_ISSUER": "VARCHAR",
+        "INVESTMENT_COUNTRY": "VARCHAR",
+        "IS_RESTRICTED_SECURITY": "VARCHAR",
+        "FAIR_VALUE_LEVEL": "VARCHAR",
+        "DERIVATIVE_CAT": "VARCHAR",
+    },
+    "IDENTIFIERS.tsv": {
+        "HOLDING_ID": "BIGINT",
+        "IDENTIFIERS_ID": "BIGINT",
+        "IDENTIFIER_ISIN": "VARCHAR",
+        "IDENTIFIER_TICKER": "VARCHAR",
+        "OTHER_IDENTIFIER": "VARCHAR",
+        "OTHER_IDENTIFIER_DESC": "VARCHAR",
+    },
+    "DEBT_SECURITY.tsv": {
+        "HOLDING_ID": "BIGINT",
+        "MATURITY_DATE": "DATE",
+        "COUPON_TYPE": "VARCHAR",
+        "ANNUALIZED_RATE": "DECIMAL(36,12)",
+        "IS_DEFAULT": "VARCHAR",
+        "ARE_ANY_INTEREST_PAYMENT": "VARCHAR",
+        "IS_ANY_PORTION_INTEREST_PAID": "VARCHAR",
+        "IS_CONVTIBLE_MANDATORY": "VARCHAR",
+        "IS_CONVTIBLE_CONTINGENT": "VARCHAR",
+    },
+    "DEBT_SECURITY_REF_INSTRUMENT.tsv": {
+        "HOLDING_ID": "BIGINT",
+        "DEBT_SECURITY_REF_ID": "BIGINT",
+        "ISSUER_NAME": "VARCHAR",
+        "ISSUE_TITLE": "VARCHAR",
+        "CURRENCY_CODE": "VARCHAR",
+        "CUSIP": "VARCHAR",
+        "ISIN": "VARCHAR",
+        "TICKER": "VARCHAR",
+        "OTHER_IDENTIFIER": "VARCHAR",
+        "OTHER_DESC": "VARCHAR",
+    },
+    "CONVERTIBLE_SECURITY_CURRENCY.tsv": {
+        "HOLDING_ID": "BIGINT",
+        "CONVERTIBLE_SECURITY_ID": "BIGINT",
+        "CONVERSION_RATIO": "DECIMAL(36,12)",
+        "CURRENCY_CODE": "VARCHAR",
+    },
+    "REPURCHASE_AGREEMENT.tsv": {
+        "HOLDING_ID": "BIGINT",
+        "TRANSACTION_TYPE": "VARCHAR",
+        "IS_CLEARED": "VARCHAR",
+        "CENTRAL_COUNTER_PARTY": "VARCHAR",
+        "IS_TRIPARTY": "VARCHAR",
+        "REPURCHASE_RATE": "DECIMAL(36,12)",
+        "MATURITY_DATE": "DATE",
+    },
+    "REPURCHASE_COUNTERPARTY.tsv": {
+        "HOLDING_ID": "BIGINT",
+        "REPURCHASE_COUNTERPARTY_ID": "BIGINT",
+        "NAME": "VARCHAR",
+        "LEI": "VARCHAR",
+    },
+    "REPURCHASE_COLLATERAL.tsv": {
+        "HOLDING_ID": "BIGINT",
+        "REPURCHASE_COLLATERAL_ID": "BIGINT",
+        "PRINCIPAL_AMOUNT": "DECIMAL(36,12)",
+        "PRINCIPAL_CURRENCY_CODE": "VARCHAR",
+        "COLLATERAL_AMOUNT": "DECIMAL(36,12)",
+        "COLLATERAL_CURRENCY_CODE": "VARCHAR",
+        "INVESTMENT_CAT": "VARCHAR",
+        "OTHER_INTRUMENT_DESC": "VARCHAR",
+    },
+    "DERIVATIVE_COUNTERPARTY.tsv": {
+        "HOLDING_ID": "BIGINT",
+        "DERIVATIVE_COUNTERPARTY_ID": "BIGINT",
+        "DERIVATIVE_COUNTERPARTY_NAME": "VARCHAR",
+        "DERIVATIVE_COUNTERPARTY_LEI": "VARCHAR",
+    },
+    "SWAPTION_OPTION_WARNT_DERIV.tsv": {
+        "HOLDING_ID": "BIGINT",
+        "PUT_OR_CALL": "VARCHAR",
+        "WRITTEN_OR_PURCHASED": "VARCHAR",
+        "SHARES_CNT": "DECIMAL(36,12)",
+        "PRINCIPAL_AMOUNT": "DECIMAL(36,12)",
+        "CURRENCY_CODE": "VARCHAR",
+        "EXERCISE_PRICE": "DECIMAL(36,12)",
+        "EXPIRATION_DATE": "DATE",
+        "UNREALIZED_APPRECIATION": "DECIMAL(36,12)",
+    },
+    "DESC_REF_INDEX_BASKET.tsv": {
+        "HOLDING_ID": "BIGINT",
+        "INDEX_NAME": "VARCHAR",
+        "INDEX_IDENTIFIER": "VARCHAR",
+        "NARRATIVE_DESC": "VARCHAR",
+    },
+    "DESC_REF_INDEX_COMPONENT.tsv": {
+        "HOLDING_ID": "BIGINT",
+        "DESC_REF_INDEX_COMPONENT_ID": "BIGINT",
+        "NAME": "VARCHAR",
+        "CUSIP": "VARCHAR",
+        "ISIN": "VARCHAR",
+        "TICKER": "VARCHAR",
+        "OTHER_IDENTIFIER": "VARCHAR",
+        "OTHER_DESC": "VARCHAR",
+        "NOTIONAL_AMOUNT": "DECIMAL(36,12)",
+        "CURRENCY_CODE": "VARCHAR",
+        "VALUE": "DECIMAL(36,12)",
+        "ISSUER_CURRENCY_CODE": "VARCHAR",
+    },
+    "DESC_REF_OTHER.tsv": {
+        "HOLDING_ID": "BIGINT",
+        "DESC_REF_OTHER_ID": "BIGINT",
+        "ISSUER_NAME": "VARCHAR",
+        "ISSUE_TITLE": "VARCHAR",
+        "CUSIP": "VARCHAR",
+        "ISIN": "VARCHAR",
+        "TICKER": "VARCHAR",
+        "OTHER_IDENTIFIER": "VARCHAR",
+        "OTHER_DESC": "VARCHAR",
+    },
+    "FUT_FWD_NONFOREIGNCUR_CONTRACT.tsv": {
+        "HOLDING_ID": "BIGINT",
+        "PAYOFF_PROFILE": "VARCHAR",
+        "EXPIRATION_DATE": "DATE",
+        "NOTIONAL_AMOUNT": "DECIMAL(36,12)",
+        "CURRENCY_CODE": "VARCHAR",
+        "UNREALIZED_APPRECIATION": "DECIMAL(36,12)",
+    },
+    "FWD_FOREIGNCUR_CONTRACT_SWAP.tsv": {
+        "HOLDING_ID": "BIGINT",
+        "CURRENCY_SOLD_AMOUNT": "DECIMAL(36,12)",
+        "DESC_CURRENCY_SOLD": "VARCHAR",
+        "CURRENCY_PURCHASED_AMOUNT": "DECIMAL(36,12)",
+        "DESC_CURRENCY_PURCHASED": "VARCHAR",
+        "SETTLEMENT_DATE": "DATE",
+        "UNREALIZED_APPRECIATION": "DECIMAL(36,12)",
+    },
+    "NONFOREIGN_EXCHANGE_SWAP.tsv": {
+        "HOLDING_ID": "BIGINT",
+        "SWAP_FLAG": "VARCHAR",
+        "TERMINATION_DATE": "DATE",
+        "UPFRONT_PAYMENT": "DECIMAL(36,12)",
+        "PMNT_CURRENCY_CODE": "VARCHAR",
+        "UPFRONT_RECEIPT": "DECIMAL(36,12)",
+        "RCPT_CURRENCY_CODE": "VARCHAR",
+        "NOTIONAL_AMOUNT": "DECIMAL(36,12)",
+        "CURRENCY_CODE": "VARCHAR",
+        "UNREALIZED_APPRECIATION": "DECIMAL(36,12)",
+        "FIXED_OR_FLOATING_RECEIPT": "VARCHAR",
+        "FIXED_RATE_RECEIPT": "DECIMAL(36,12)",
+        "FLOATING_RATE_INDEX_RECEIPT": "VARCHAR",
+        "FLOATING_RATE_SPREAD_RECEIPT": "DECIMAL(36,12)",
+        "CURRENCY_CODE_RECEIPT": "VARCHAR",
+        "AMOUNT_RECEIPT": "DECIMAL(36,12)",
+        "FIXED_OR_FLOATING_PAYMENT": "VARCHAR",
+        "FIXED_RATE_PAYMENT": "DECIMAL(36,12)",
+        "FLOATING_RATE_INDEX_PAYMENT": "VARCHAR",
+        "FLOATING_RATE_SPREAD_PAYMENT": "DECIMAL(36,12)",
+        "CURRENCY_CODE_PAYMENT": "VARCHAR",
+        "AMOUNT_PAYMENT": "DECIMAL(36,12)",
+    },
+    "FLOATING_RATE_RESET_TENOR.tsv": {
+        "HOLDING_ID": "BIGINT",
+        "RATE_RESET_TENOR_ID": "BIGINT",
+        "RECEIPT_OR_PAYMENT": "VARCHAR",
+        "RESET_DATE": "VARCHAR",
+        "RESET_DATE_UNIT": "BIGINT",
+        "RATE_TENOR": "VARCHAR",
+        "RATE_TENOR_UNIT": "BIGINT",
+    },
+    "OTHER_DERIV.tsv": {
+        "HOLDING_ID": "BIGINT",
+        "OTHER_DESC": "VARCHAR",
+        "TERMINATION_DATE": "DATE",
+        "UNREALIZED_APPRECIATION": "DECIMAL(36,12)",
+    },
+    "OTHER_DERIV_NOTIONAL_AMOUNT.tsv": {
+        "HOLDING_ID": "BIGINT",
+        "OTHER_DERIV_NOTIONAL_AMOUNT_ID": "BIGINT",
+        "NOTIONAL_AMOUNT": "DECIMAL(36,12)",
+        "CURRENCY_CODE": "VARCHAR",
+    },
+    "SECURITIES_LENDING.tsv": {
+        "HOLDING_ID": "BIGINT",
+        "IS_CASH_COLLATERAL": "VARCHAR",
+        "CASH_COLLATERAL_AMOUNT": "DECIMAL(36,12)",
+        "IS_NON_CASH_COLLATERAL": "VARCHAR",
+        "NON_CASH_COLLATERAL_VALUE": "DECIMAL(36,12)",
+        "IS_LOAN_BY_FUND": "VARCHAR",
+        "LOAN_VALUE": "DECIMAL(36,12)",
+    },
+    "EXPLANATORY_NOTE.tsv": {
+        "ACCESSION_NUMBER": "VARCHAR",
+        "EXPLANATORY_NOTE_ID": "BIGINT",
+        "ITEM_NO": "VARCHAR",
+        "EXPLANATORY_NOTE": "VARCHAR",
+    },
+}
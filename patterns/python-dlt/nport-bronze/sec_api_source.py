@@ -5,7 +5,9 @@ SEC API Bulk Download Source for DLT
 Custom DLT source to download N-PORT bulk data files from SEC API.
 
 Key features:
-- Downloads compressed JSONL files (.jsonl.gz) from SEC API
+- Downloads compressed JSONL files (.jsonl.gz) from SEC API, caching them
+  on disk keyed by ETag so reruns skip the download; cached months are
+  inflated once and then parsed from the JSONL copy via mmap
 - Decompresses and parses JSONL format
 - Maps repPdEnd → _as_at_date for partitioning
 - Handles authentication via API key
@@ -14,15 +16,37 @@ Key features:
 API Documentation: https://sec-api.io/docs/n-port-data-api#/bulk/form-nport/index.json
 """
 
-import gzip
+import contextlib
+import io
 import json
+import logging
+import mmap
+import multiprocessing
+import re
+import shutil
+import tempfile
+import threading
 from pathlib import Path
-from typing import Iterator, Optional, List
+from queue import Empty
+from typing import BinaryIO, Iterator, Optional, List
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
 import dlt
 from dlt.sources import DltResource
 
+try:
+    from isal import igzip as gzip  # ISA-L: SIMD inflate and CRC32
+except ImportError:
+    import gzip
+
+try:
+    from orjson import loads as json_loads  # raises a json.JSONDecodeError subclass
+except ImportError:
+    def json_loads(data):
+        # stdlib json won't take a memoryview
+        return json.loads(bytes(data))
+
 
 # =============================================================================
 # CONFIGURATION
@@ -35,103 +59,501 @@ BULK_API_BASE_URL = "https://api.sec-api.io/bulk/form-nport"
 # The SEC API uses 'repPdEnd' (reporting period end) as the "as of" date
 AS_AT_DATE_FIELD = "repPdEnd"
 
+# Per-record warnings (bad JSON lines, missing dates) are logged this many
+# times per month, then only counted and summarised once the month is done
+MAX_WARNINGS = 10
+
+logger = logging.getLogger(__name__)
+
+# Shared SEC API session - keeps TCP/TLS connections alive across the index
+# request and every month download, including concurrent months
+SEC_API_SESSION = requests.Session()
+SEC_API_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+
+# Bytes per read from the network or cache file into the gzip reader
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Records per list yielded to dlt
+YIELD_BATCH_RECORDS = 1000
+
+# Cached months are parsed in a worker process and sent back in batches of
+# this many records, with at most this many batches queued
+PARSE_BATCH_RECORDS = 10_000
+PARSE_QUEUE_BATCHES = 4
+
+# Seconds to wait for a batch before checking the parse worker is still alive
+PARSE_POLL_SECONDS = 5
+
+# Downloaded bulk files are cached here, keyed by month and server ETag, so
+# reruns over the same months don't download them again
+BULK_CACHE_DIR = Path.home() / ".cache" / "sec_api"
+
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
-def download_bulk_file(year: int, month: int, api_key: str) -> bytes:
+def bulk_file_url(year: int, month: int) -> str:
+    """Build the bulk download URL for a month."""
+    # Format: /bulk/form-nport/YEAR/YEAR-MONTH.jsonl.gz
+    # Example: /bulk/form-nport/2024/2024-10.jsonl.gz
+    return f"{BULK_API_BASE_URL}/{year}/{year}-{month:02d}.jsonl.gz"
+
+
+class CachingReader(io.RawIOBase):
+    """
+    Pass-through reader that copies everything read into a cache file.
+
+    The copy is written to a uniquely named temp file next to the cache
+    path, so concurrent runs never share one. It is only moved into place
+    by commit() - called once the caller has parsed the whole stream
+    without error - and is discarded on close otherwise, so a truncated
+    download never ends up in the cache.
+    """
+
+    def __init__(self, source: BinaryIO, cache_path: Path):
+        super().__init__()
+        self._source = source
+        self._cache_path = cache_path
+        self._part = tempfile.NamedTemporaryFile(
+            dir=cache_path.parent, prefix=f"{cache_path.name}.", suffix=".part", delete=False
+        )
+        self._committed = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._source.read(len(buffer))
+        if data:
+            self._part.write(data)
+            buffer[:len(data)] = data
+        return len(data)
+
+    def commit(self) -> None:
+        """Keep the copy: it becomes the cache file when the reader closes."""
+        self._committed = True
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        super().close()
+        self._part.close()
+        self._source.close()
+        if self._committed:
+            Path(self._part.name).replace(self._cache_path)
+            evict_stale_cache_files(self._cache_path)
+        else:
+            Path(self._part.name).unlink(missing_ok=True)
+
+
+def evict_stale_cache_files(cache_path: Path) -> None:
+    """
+    Delete cached files for older versions of the same month.
+
+    Covers both the .jsonl.gz downloads and their inflated .jsonl copies.
+    Temp files still being written (.part) are left alone.
+
+    Args:
+        cache_path: Cache path of the month's current version
+    """
+    # Cache names are {year}-{month}.{version}.jsonl[.gz]
+    month_prefix = cache_path.name.split(".", 1)[0]
+    current = {cache_path, cache_path.with_suffix("")}
+    for path in cache_path.parent.glob(f"{month_prefix}.*"):
+        if path not in current and not path.name.endswith(".part"):
+            # Best effort - another run may still have it open (Windows)
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+
+def get_bulk_file_version(url: str, params: dict) -> Optional[str]:
+    """
+    Fetch a filename-safe version tag for a bulk file with a HEAD request.
+
+    Args:
+        url: Bulk file URL
+        params: Query parameters (API token)
+
+    Returns:
+        ETag (or Last-Modified) reduced to [A-Za-z0-9_-], or None if the
+        server doesn't provide one
+    """
+    response = SEC_API_SESSION.head(url, params=params, allow_redirects=True)
+    if not response.ok:
+        return None
+
+    version = response.headers.get("ETag") or response.headers.get("Last-Modified")
+    if not version:
+        return None
+
+    return re.sub(r"[^A-Za-z0-9_-]", "", version) or None
+
+
+def get_bulk_cache_path(year: int, month: int, api_key: str) -> Optional[Path]:
+    """
+    Get the cache path for a month's bulk file at its current server version.
+
+    The path includes the server's version, so a republished month maps to
+    a new path and is downloaded again rather than served stale.
+
+    Args:
+        year: Year (e.g., 2024)
+        month: Month (1-12)
+        api_key: SEC API authentication key
+
+    Returns:
+        Cache path (which may not exist yet), or None if the server gives
+        no version to key the cache on
     """
-    Download a bulk JSONL.gz file for a specific year and month.
+    version = get_bulk_file_version(bulk_file_url(year, month), {"token": api_key})
+    if not version:
+        return None
+
+    return BULK_CACHE_DIR / str(year) / f"{year}-{month:02d}.{version}.jsonl.gz"
+
+
+def download_bulk_file(
+    year: int,
+    month: int,
+    api_key: str,
+    cache_path: Optional[Path] = None
+) -> BinaryIO:
+    """
+    Open a streaming download of the bulk JSONL.gz file for a specific month.
+
+    The body is not read here - the caller consumes it as it arrives, so
+    network receive overlaps with decompression and parsing. With a
+    cache_path the bytes are also copied into the cache as they pass
+    through.
 
     Args:
         year: Year (e.g., 2024)
         month: Month (1-12)
         api_key: SEC API authentication key
+        cache_path: Where to cache the file (see get_bulk_cache_path), or
+            None to stream without caching
 
     Returns:
-        Compressed file content as bytes
+        Buffered stream of the gzip-compressed body; close it (or use it
+        as a context manager) to release the connection. With a cache_path
+        its .raw is the CachingReader - commit() it once the stream has
+        been parsed to the end, or the copy is discarded on close
 
     Raises:
         requests.HTTPError: If download fails
     """
-    # Format: /bulk/form-nport/YEAR/YEAR-MONTH.jsonl.gz
-    # Example: /bulk/form-nport/2024/2024-10.jsonl.gz
-    url = f"{BULK_API_BASE_URL}/{year}/{year}-{month:02d}.jsonl.gz"
+    url = bulk_file_url(year, month)
 
     print(f"[*] Downloading: {url}")
 
     # API key can be passed as query parameter or header
     params = {"token": api_key}
 
-    response = requests.get(url, params=params, stream=True)
+    response = SEC_API_SESSION.get(url, params=params, stream=True)
     response.raise_for_status()
 
-    # Read the entire compressed content
-    content = response.content
-    print(f"[+] Downloaded {len(content):,} bytes")
+    size = response.headers.get("Content-Length")
+    if size:
+        print(f"[+] Streaming {int(size):,} bytes")
+
+    # Hand back the gzip bytes as sent - parse_jsonl_gz does the inflating
+    response.raw.decode_content = False
+
+    if cache_path is None:
+        source = response.raw
+    else:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        source = CachingReader(response.raw, cache_path)
+
+    # Pull the body off the socket in DOWNLOAD_CHUNK_SIZE reads, rather than
+    # the gzip reader's small ones
+    return io.BufferedReader(source, buffer_size=DOWNLOAD_CHUNK_SIZE)
+
+
+def _parse_lines(buffer, end: int, offset: int, bad_lines: int):
+    """
+    Parse the JSON lines in buffer[:end].
+
+    Each line goes to the JSON parser as a memoryview slice of buffer, so
+    no bytes object is allocated per line.
 
-    return content
+    Args:
+        buffer: Bytes-like object holding whole lines up to end
+        end: Position just past the last line to parse
+        offset: Stream position of buffer[0], for warnings
+        bad_lines: Unparseable lines seen so far in this stream
 
+    Yields:
+        Parsed JSON objects (one per line)
 
-def parse_jsonl_gz(compressed_data: bytes) -> Iterator[dict]:
+    Returns:
+        Updated bad_lines count
+    """
+    with memoryview(buffer) as view:
+        pos = 0
+        while pos < end:
+            newline = buffer.find(b'\n', pos, end)
+            if newline == -1:
+                newline = end
+
+            # SEC JSONL is well-formed; only a trailing/empty line can be blank
+            if newline > pos:
+                try:
+                    record = json_loads(view[pos:newline])
+                except json.JSONDecodeError as e:
+                    bad_lines += 1
+                    if bad_lines <= MAX_WARNINGS:
+                        logger.warning("Failed to parse line at byte %s: %s",
+                                       f"{offset + pos:,}", e)
+                else:
+                    yield record
+
+            pos = newline + 1
+
+    return bad_lines
+
+
+def parse_jsonl_gz(compressed_stream: BinaryIO) -> Iterator[dict]:
     """
     Decompress and parse JSONL.gz content.
 
+    The stream is inflated DOWNLOAD_CHUNK_SIZE bytes at a time and the
+    complete lines in each block are parsed in place, so only about one
+    block is held decompressed and the first record is yielded immediately.
+
     Args:
-        compressed_data: Gzip-compressed JSONL data
+        compressed_stream: File-like object of gzip-compressed JSONL data
 
     Yields:
         Parsed JSON objects (one per line)
     """
-    # Decompress
-    decompressed = gzip.decompress(compressed_data)
+    gz = gzip.open(compressed_stream, 'rb')
 
-    # Parse JSONL (one JSON object per line)
-    lines = decompressed.decode('utf-8').strip().split('\n')
+    # Lines stay bytes - the JSON parser validates and decodes the UTF-8 itself.
+    # A line split across blocks stays in buffer until its newline arrives
+    buffer = bytearray()
+    offset = 0
+    bad_lines = 0
+    while block := gz.read(DOWNLOAD_CHUNK_SIZE):
+        buffer += block
+        end = buffer.rfind(b'\n') + 1
+        bad_lines = yield from _parse_lines(buffer, end, offset, bad_lines)
+        del buffer[:end]
+        offset += end
 
-    print(f"[+] Decompressed {len(lines):,} records")
+    # Last line without a trailing newline
+    bad_lines = yield from _parse_lines(buffer, len(buffer), offset, bad_lines)
 
-    for line_num, line in enumerate(lines, 1):
-        if not line.strip():
-            continue
+    if bad_lines > MAX_WARNINGS:
+        logger.warning("Skipped %s unparseable lines (%s warnings suppressed)",
+                       f"{bad_lines:,}", f"{bad_lines - MAX_WARNINGS:,}")
 
+
+def inflate_cached_file(path: Path) -> Path:
+    """
+    Get the decompressed copy of a cached bulk file, writing it if needed.
+
+    The copy sits next to the .jsonl.gz and shares its version in the name,
+    so it is rebuilt whenever the month is downloaded again.
+
+    Args:
+        path: Cached JSONL.gz file
+
+    Returns:
+        Path of the decompressed JSONL file
+    """
+    jsonl_path = path.with_suffix("")
+    if jsonl_path.exists():
+        return jsonl_path
+
+    # Written to a uniquely named temp file and renamed, so a killed run
+    # never leaves a truncated copy and concurrent runs never share one
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f"{jsonl_path.name}.", suffix=".part", delete=False
+    ) as out:
+        part_path = Path(out.name)
         try:
-            yield json.loads(line)
-        except json.JSONDecodeError as e:
-            print(f"[!] Warning: Failed to parse line {line_num}: {e}")
-            continue
+            with gzip.open(path, 'rb') as gz:
+                shutil.copyfileobj(gz, out, DOWNLOAD_CHUNK_SIZE)
+        except BaseException:
+            out.close()
+            part_path.unlink(missing_ok=True)
+            raise
+    part_path.replace(jsonl_path)
+
+    # Copies inflated before the current version was cached
+    evict_stale_cache_files(path)
 
+    return jsonl_path
 
-def add_partition_metadata(record: dict) -> dict:
+
+def parse_jsonl_file(path: Path) -> Iterator[dict]:
     """
-    Add _as_at_date field to record for partitioning.
+    Parse an uncompressed JSONL file through a read-only mmap.
 
-    Maps the SEC API's repPdEnd field to our _as_at_date partition column.
+    Lines are parsed straight out of the mapping, so the file is never
+    copied onto the Python heap and repeat runs are served from the OS
+    page cache.
 
     Args:
-        record: Original SEC API record
+        path: JSONL file
 
-    Returns:
-        Record with _as_at_date field added
+    Yields:
+        Parsed JSON objects (one per line)
     """
-    # Extract the reporting period end date
-    rep_pd_end = record.get(AS_AT_DATE_FIELD)
+    with open(path, 'rb') as f:
+        if not f.seek(0, io.SEEK_END):
+            return  # mmap can't map an empty file
 
-    if not rep_pd_end:
-        # Fallback: try to get from genInfo.repPdEnd (nested location)
-        rep_pd_end = record.get("genInfo", {}).get("repPdEnd")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            bad_lines = yield from _parse_lines(mm, len(mm), 0, 0)
+
+    if bad_lines > MAX_WARNINGS:
+        logger.warning("Skipped %s unparseable lines (%s warnings suppressed)",
+                       f"{bad_lines:,}", f"{bad_lines - MAX_WARNINGS:,}")
+
+
+def _parse_file_to_queue(path: str, queue, batch_size: int) -> None:
+    """
+    Worker process body: parse a cached JSONL.gz file into queued batches.
+
+    The file is inflated to a JSONL copy on first use and that copy is
+    parsed through mmap. Puts lists of up to batch_size records, then None
+    when done. A failure is sent as an exception before the final None.
+    """
+    try:
+        batch = []
+        for record in parse_jsonl_file(inflate_cached_file(Path(path))):
+            batch.append(record)
+            if len(batch) >= batch_size:
+                queue.put(batch)
+                batch = []
+        if batch:
+            queue.put(batch)
+    except Exception as e:
+        queue.put(RuntimeError(f"Failed to parse {path}: {e}"))
+    finally:
+        queue.put(None)
 
-    if rep_pd_end:
-        # Parse the date and format as YYYY-MM-DD
-        # SEC API format: "2024-10-31" (already in correct format)
-        record["_as_at_date"] = rep_pd_end
-    else:
-        # If no date found, log warning and use None
-        print(f"[!] Warning: No repPdEnd found in record: {record.get('accessionNo', 'UNKNOWN')}")
-        record["_as_at_date"] = None
 
-    return record
+def _parse_worker(tasks, results, batch_size: int) -> None:
+    """
+    Worker process body: parse each cached file path taken from tasks.
+
+    Every file's batches are followed by None (see _parse_file_to_queue),
+    so one worker serves many months. Exits on a None task.
+    """
+    while (path := tasks.get()) is not None:
+        _parse_file_to_queue(path, results, batch_size)
+
+
+class _ParseWorker:
+    """A long-lived parse process with its own task and result queues."""
+
+    def __init__(self):
+        # spawn, not fork - callers run inside dlt's extract threads
+        ctx = multiprocessing.get_context("spawn")
+        self.tasks = ctx.Queue()
+        self.results = ctx.Queue(maxsize=PARSE_QUEUE_BATCHES)
+        self.process = ctx.Process(
+            target=_parse_worker,
+            args=(self.tasks, self.results, PARSE_BATCH_RECORDS),
+            daemon=True,
+        )
+        self.process.start()
+
+    def stop(self) -> None:
+        """Terminate the process - used when its queues are in an unknown state."""
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+
+
+# Idle parse workers, reused across months so each month doesn't pay for a
+# fresh interpreter and imports. Grows to the number of months parsed at once.
+_idle_parse_workers: List[_ParseWorker] = []
+_parse_workers_lock = threading.Lock()
+
+
+def _checkout_parse_worker() -> _ParseWorker:
+    """Take an idle parse worker, or start a new one if none is idle."""
+    with _parse_workers_lock:
+        while _idle_parse_workers:
+            worker = _idle_parse_workers.pop()
+            if worker.process.is_alive():
+                return worker
+            worker.stop()
+    return _ParseWorker()
+
+
+def parse_cached_file(path: Path) -> Iterator[dict]:
+    """
+    Inflate and parse a cached bulk file in a separate process.
+
+    Inflate (first use only - see inflate_cached_file) and JSON parsing both
+    run under the worker's own GIL, so several months can be processed in
+    parallel instead of contending in one interpreter. Records come back in
+    pickled batches to amortize IPC; the bounded queue keeps the worker at
+    most a few batches ahead. Workers are reused for later months once a
+    file has been read to the end.
+
+    If the file can't be parsed, it and its inflated copy are deleted so the
+    next run downloads the month again.
+
+    Args:
+        path: Cached JSONL.gz file
+
+    Yields:
+        Parsed JSON objects (one per line)
+
+    Raises:
+        RuntimeError: If parsing failed, or the worker died (e.g. killed
+            by the OOM killer) before sending all its records
+    """
+    worker = _checkout_parse_worker()
+    worker.tasks.put(str(path))
+    error = None
+    finished = False
+
+    try:
+        while True:
+            # Checked before waiting: anything a dead worker sent is already
+            # readable, so a timeout after that means nothing more is coming
+            alive = worker.process.is_alive()
+            try:
+                batch = worker.results.get(timeout=PARSE_POLL_SECONDS)
+            except Empty:
+                if not alive:
+                    raise RuntimeError(
+                        f"Parse worker for {path} exited with code "
+                        f"{worker.process.exitcode} before finishing"
+                    )
+                continue
+
+            if batch is None:
+                finished = True
+                break
+            if isinstance(batch, Exception):
+                # Keep reading up to the final None so the worker can be reused
+                error = batch
+                continue
+            yield from batch
+    finally:
+        if finished:
+            with _parse_workers_lock:
+                _idle_parse_workers.append(worker)
+        else:
+            # Stopped mid-file (worker died, or the consumer closed early),
+            # so the worker may still be sending this file's batches
+            worker.stop()
+
+    if error is not None:
+        # Not done for a dead worker - the file may well be fine there
+        path.unlink(missing_ok=True)
+        path.with_suffix("").unlink(missing_ok=True)
+        logger.warning("Deleted unreadable cache file %s; it will be downloaded again", path)
+        raise error
 
 
 def get_available_months(api_key: str) -> List[dict]:
@@ -147,7 +569,7 @@ def get_available_months(api_key: str) -> List[dict]:
     url = f"{BULK_API_BASE_URL}/index.json"
     params = {"token": api_key}
 
-    response = requests.get(url, params=params)
+    response = SEC_API_SESSION.get(url, params=params)
     response.raise_for_status()
 
     return response.json()
@@ -159,7 +581,9 @@ def get_available_months(api_key: str) -> List[dict]:
 
 @dlt.resource(
     name="nport_filings",
+    table_name="nport_filings",  # Fixed, so per-month resource names share one table
     write_disposition="append",  # Append mode for incremental loads
+    parallelized=True,  # Months download and parse concurrently in dlt's extract pool
     columns={
         "_as_at_date": {
             "data_type": "date",
@@ -177,10 +601,10 @@ def nport_bulk_resource(
     DLT resource to load N-PORT bulk data for a specific month.
 
     This resource:
-    1. Downloads the compressed JSONL file for the specified month
-    2. Decompresses and parses the JSONL format
+    1. Streams the compressed JSONL file for the specified month
+    2. Decompresses and parses the JSONL format as it arrives
     3. Adds _as_at_date field for partitioning
-    4. Yields records for DLT to load
+    4. Yields records for DLT to load, in lists of YIELD_BATCH_RECORDS
 
     Args:
         year: Year (e.g., 2024)
@@ -188,22 +612,74 @@ def nport_bulk_resource(
         api_key: SEC API key (loaded from secrets by default)
 
     Yields:
-        N-PORT filing records with _as_at_date field
+        Lists of N-PORT filing records with _as_at_date field
     """
     print(f"\n[*] Loading N-PORT bulk data for {year}-{month:02d}")
 
-    # Download the file
-    compressed_data = download_bulk_file(year, month, api_key)
-
-    # Parse JSONL
-    records = parse_jsonl_gz(compressed_data)
-
-    # Add partition metadata and yield
     record_count = 0
-    for record in records:
-        record_with_metadata = add_partition_metadata(record)
-        yield record_with_metadata
-        record_count += 1
+    missing_dates = 0
+
+    # A month's filings share a handful of distinct repPdEnd values - keep
+    # one string object per value so every record references the same one
+    date_cache: dict[str, str] = {}
+
+    # Records are handed to dlt in lists, not one dict per yield
+    batch = []
+
+    # Set when a download is being copied into the cache
+    cache_writer = None
+
+    with contextlib.ExitStack() as stack:
+        cache_path = get_bulk_cache_path(year, month, api_key)
+
+        if cache_path is not None and cache_path.exists():
+            # Cached months are parsed in a worker process
+            print(f"[*] Using cached: {cache_path}")
+            records = stack.enter_context(contextlib.closing(parse_cached_file(cache_path)))
+        else:
+            compressed_stream = stack.enter_context(
+                download_bulk_file(year, month, api_key, cache_path)
+            )
+            records = parse_jsonl_gz(compressed_stream)
+            if cache_path is not None:
+                cache_writer = compressed_stream.raw
+
+        # Map repPdEnd (or genInfo.repPdEnd) to the _as_at_date partition
+        # column. Records are freshly parsed, so they are updated in place
+        for record_count, record in enumerate(records, 1):
+            rep_pd_end = record.get(AS_AT_DATE_FIELD)
+
+            if not rep_pd_end:
+                gen_info = record.get("genInfo")
+                rep_pd_end = gen_info.get("repPdEnd") if gen_info else None
+
+                if not rep_pd_end:
+                    missing_dates += 1
+                    if missing_dates <= MAX_WARNINGS:
+                        logger.warning("No repPdEnd found in record: %s", record.get('accessionNo', 'UNKNOWN'))
+                    rep_pd_end = None
+
+            if rep_pd_end:
+                rep_pd_end = date_cache.setdefault(rep_pd_end, rep_pd_end)
+
+            record["_as_at_date"] = rep_pd_end
+            batch.append(record)
+
+            if len(batch) >= YIELD_BATCH_RECORDS:
+                yield batch
+                batch = []
+
+        # parse_jsonl_gz only finishes once gzip has reached the end-of-stream
+        # marker (and checked its CRC), so the cached copy is complete
+        if cache_writer is not None:
+            cache_writer.commit()
+
+        if batch:
+            yield batch
+
+    if missing_dates > MAX_WARNINGS:
+        logger.warning("%s records had no repPdEnd (%s warnings suppressed)",
+                       f"{missing_dates:,}", f"{missing_dates - MAX_WARNINGS:,}")
 
     print(f"[+] Processed {record_count:,} N-PORT filings")
 
@@ -216,7 +692,9 @@ def sec_api_nport_source(
     """
     DLT source for SEC API N-PORT bulk downloads.
 
-    This source creates a resource for each month to download.
+    This source creates a resource for each month to download. The
+    resources are parallelized, so dlt's extract worker pool (bounded by
+    [extract] workers, default 5) streams several months at once.
 
     Args:
         months: List of (year, month) tuples to download
@@ -243,8 +721,11 @@ def sec_api_nport_source(
         ```
     """
     for year, month in months:
-        # Create a unique resource for each month
-        yield nport_bulk_resource(year=year, month=month, api_key=api_key)
+        # Create a uniquely named resource for each month - all of them load
+        # into the nport_filings table
+        yield nport_bulk_resource(year=year, month=month, api_key=api_key).with_name(
+            f"nport_filings_{year}_{month:02d}"
+        )
 
 
 # =============================================================================
@@ -297,21 +778,11 @@ def generate_month_range(start_year: int, start_month: int,
         >>> generate_month_range(2024, 10, 2024, 12)
         [(2024, 10), (2024, 11), (2024, 12)]
     """
-    months = []
-
-    current_year = start_year
-    current_month = start_month
-
-    while (current_year < end_year) or (current_year == end_year and current_month <= end_month):
-        months.append((current_year, current_month))
-
-        # Increment month
-        current_month += 1
-        if current_month > 12:
-            current_month = 1
-            current_year += 1
+    # Count months from year 0 so the range is a single run of integers
+    start = start_year * 12 + (start_month - 1)
+    end = end_year * 12 + (end_month - 1)
 
-    return months
+    return [(i // 12, i % 12 + 1) for i in range(start, end + 1)]
 
 
 # =============================================================================